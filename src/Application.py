@@ -1,5 +1,7 @@
+import os
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -44,6 +46,13 @@ class Application(QtWidgets.QApplication):
         """
         return Application.instance()._projectManager
 
+    @staticmethod
+    def executor() -> ThreadPoolExecutor:
+        """
+        Returns the thread pool shared by the background tasks of the application.
+        """
+        return Application.instance()._executor
+
     def __init__(self, args):
         """
         Initializes a new instance of the Application class.
@@ -65,6 +74,10 @@ class Application(QtWidgets.QApplication):
 
         sys.excepthook = self._handleException
 
+        # A single long-lived pool so background tasks share a bounded thread budget
+        # instead of spawning a new thread per task.
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="PhantomWorker")
+
         self._modelsDownloader = ModelsDownloader(
             models_zip_url=constants.models_zip_url,
             release_tag=constants.models_release_tag,
@@ -79,6 +92,10 @@ class Application(QtWidgets.QApplication):
         self._icon = QtGui.QIcon("res/img/icon.png")
         self.setWindowIcon(self._icon)
 
+        # Thumbnails and image pixmaps are cached in the QPixmapCache. The default limit (10 MB)
+        # is too small to hold the thumbnails of a regular project.
+        QtGui.QPixmapCache.setCacheLimit(constants.app_pixmap_cache_limit)
+
         self.setStyle(QtWidgets.QStyleFactory.create("Fusion"))
 
         p = self.palette()
@@ -115,7 +132,7 @@ class Application(QtWidgets.QApplication):
         if not self._projectManager.ensureModelsAreDownloaded():
             return 1
 
-        from .Main.ProjectExplorerPage import ShellWindow  # Avoid circular imports
+        from .ShellWindow import ShellWindow  # Avoid circular imports
         self._shell = ShellWindow()
         self._shell.showMaximized()
 
@@ -124,6 +141,7 @@ class Application(QtWidgets.QApplication):
         exitCode = super().exec()
 
         self._imageProcessorService.terminate()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
         Application._instance = None
         return exitCode
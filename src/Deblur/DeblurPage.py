@@ -285,7 +285,7 @@ class DeblurPage(QtWidgets.QWidget, NavigationPage):
     def _onConfigChanged(self) -> None:
         self._updatePreview()
 
-    @QtCore.Slot()
+    @QtCore.Slot(bool)
     def _onComparingChanged(self, comparing: bool):
         self._leftSide.setCurrentIndex(1 if comparing else 0)
 
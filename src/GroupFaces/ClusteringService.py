@@ -1,3 +1,4 @@
+import logging
 from dataclasses import dataclass
 
 import numpy as np
@@ -60,30 +61,53 @@ def find_best_group(face: Face, groups: list[Group]) -> Group:
     Returns:
         Group: The best group. Or None if no group is close enough.
     """
-    if face.encoding is None:
-        raise ValueError("Face has no encoding.")
+    index = find_best_group_index(face, stack_centroids(groups))
+    return groups[index] if index is not None else None
+
+
+def stack_centroids(groups: list[Group]) -> np.ndarray:
+    """
+    Stacks the centroids of the groups in a single (G, 128) matrix, so the distances from
+    a face to all the groups can be computed at once.
 
-    best_group = None
-    best_distance = np.inf
+    Args:
+        groups (list[Group]): The groups.
 
+    Returns:
+        np.ndarray: The centroids, one row per group.
+    """
     for group in groups:
         if group.centroid is None:
             group.recompute_centroid()
+    return np.array([group.centroid for group in groups], dtype=np.float64)
+
+
+def find_best_group_index(face: Face, centroids: np.ndarray) -> int:
+    """
+    Finds the index of the best group for the face.
+
+    Args:
+        face (Face): The face to find the best group for.
+        centroids (np.ndarray): The centroids of the groups, as returned by stack_centroids().
+
+    Returns:
+        int: The index of the best group. Or None if no group is close enough.
+    """
+    if face.encoding is None:
+        raise ValueError("Face has no encoding.")
 
-        # Compute the distance between the face and the group centroid. (np.array)
-        centroid = group.centroid
-        encoding = face.encoding
-        distance = np.linalg.norm(centroid - encoding)
+    if len(centroids) == 0:
+        return None
 
-        if distance < best_distance:
-            best_group = group
-            best_distance = distance
+    distances = np.linalg.norm(centroids - face.encoding, axis=1)
+    index = int(np.argmin(distances))
+    best_distance = distances[index]
 
-    print(f"Best group: {best_group}, distance: {best_distance}")
+    logging.debug("Best group: %s, distance: %s", index, best_distance)
     if best_distance >= cluster_eps:
         return None
 
-    return best_group
+    return index
 
 
 @dataclass(frozen=True, slots=True)
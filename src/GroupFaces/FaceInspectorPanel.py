@@ -39,7 +39,9 @@ class FaceInspectorPanel(InspectorPanelBase):
         """
         Inspects nothing.
         """
-        self._table.clear()
+        self._inspectGeneration += 1
         self._preview.setImage(None)
-        self._table.addHeader(__("No face selected"))
-        self._table.addInfo(__("Select a face to see its properties."))
+        with self._table.batch():
+            self._table.clear()
+            self._table.addHeader(__("No face selected"))
+            self._table.addInfo(__("Select a face to see its properties."))
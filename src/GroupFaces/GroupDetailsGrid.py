@@ -85,10 +85,14 @@ class GroupDetailsGrid(GridBase):
         # sort by confidence
         self._faces.sort(key=lambda f: f.confidence, reverse=True)
 
-        for face in self._faces:
-            pixmap = face.image.get_pixmap()
-            imageBasename = face.image.display_name
-            self.addItemCore(pixmap, imageBasename)
+        self.beginBulkAdd()
+        try:
+            for face in self._faces:
+                pixmap = face.image.get_pixmap()
+                imageBasename = face.image.display_name
+                self.addItemCore(pixmap, imageBasename)
+        finally:
+            self.endBulkAdd()
 
         # Select the first item
         if len(self._faces) > 0:
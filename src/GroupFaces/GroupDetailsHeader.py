@@ -15,6 +15,12 @@ class GroupDetailsHeaderWidget(QtWidgets.QWidget):
     combineGroupTriggered = QtCore.Signal(Group)
     """Emited when the "Combine group" action is triggered."""
 
+    # The name label style for named and unnamed groups. The style is only applied when it
+    # changes, so refreshing the header does not parse the stylesheet again.
+    _namedStyle = "color: black;"
+
+    _unnamedStyle = "color: #0078d7;"
+
     def __init__(self, parent: QtWidgets.QWidget = None) -> None:
         """
         Initialize a new instance of the GroupDetailsHeaderWidget class.
@@ -92,8 +98,9 @@ class GroupDetailsHeaderWidget(QtWidgets.QWidget):
             self._subtitleLabel.setText(__("{count} images", count=uniqueImagesCount))
         else:
             self._subtitleLabel.setText(__("{count} image", count=uniqueImagesCount))
-        titleColor = "black" if group.name else "#0078d7"
-        self._nameLabel.setStyleSheet(f"color: {titleColor};")
+        style = self._namedStyle if group.name else self._unnamedStyle
+        if self._nameLabel.styleSheet() != style:
+            self._nameLabel.setStyleSheet(style)
 
     def refresh(self) -> None:
         """
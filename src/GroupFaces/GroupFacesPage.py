@@ -167,9 +167,7 @@ class GroupFacesPageContent(QtWidgets.QWidget):
         """
         Called when an image is processed.
         """
-        project = self._workspace.project()
-        for face in image.faces:
-            project.add_face_to_best_group(face)
+        self._workspace.project().add_faces_to_best_groups(image.faces)
 
     def refreshGroups(self) -> None:
         groups = self._workspace.project().groups
@@ -196,9 +194,7 @@ class GroupFacesPageContent(QtWidgets.QWidget):
             return
 
         # We will try to find a group for the new image (or a new group if no group is found)
-        project = self._workspace.project()
-        for face in faces:
-            project.add_face_to_best_group(face)
+        self._workspace.project().add_faces_to_best_groups(faces)
         self._workspace.setDirty()
         self.refreshGroups()
 
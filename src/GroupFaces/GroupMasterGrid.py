@@ -66,14 +66,18 @@ class GroupMasterGrid(GridBase):
         # 2. In second place, the group with the most faces is displayed.
         self._groups.sort(key=lambda group: (group.name != "", len(group.faces)), reverse=True)
 
-        for group in self._groups:
-            count = len(group.faces)
-            if count == 0:
-                continue
-            w, h = self.iconSize().width(), self.iconSize().height()
-            pixmap = group.main_face.get_avatar_pixmap(w, h)
-            text = f"{group.name} ({count})" if group.name else f"({count})"
-            self.addItemCore(pixmap, text)
+        w, h = self.iconSize().width(), self.iconSize().height()
+        self.beginBulkAdd()
+        try:
+            for group in self._groups:
+                count = len(group.faces)
+                if count == 0:
+                    continue
+                pixmap = group.main_face.get_avatar_pixmap(w, h)
+                text = f"{group.name} ({count})" if group.name else f"({count})"
+                self.addItemCore(pixmap, text)
+        finally:
+            self.endBulkAdd()
 
     def groups(self) -> list[Group]:
         """
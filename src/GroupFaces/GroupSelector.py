@@ -1,6 +1,7 @@
 from PySide6 import QtCore, QtGui, QtWidgets
 from ..Widgets.GridBase import GridBase
 from ..Models import Group
+from .. import resources
 from ..l10n import __
 
 
@@ -57,15 +58,19 @@ class GroupSelector(QtWidgets.QDialog):
         selectCancelLayout.addWidget(self._cancelButton)
 
         gridSize = self._groupsGrid.gridSize()
-        if showNewGroupOption:
-            pixmap = self._getNewGroupPixmap(gridSize.width(), gridSize.height())
-            text = __("New group")
-            self._groupsGrid.addItemCore(pixmap, text, Group())
-
-        for group in groups:
-            pixmap = group.main_face.get_avatar_pixmap(gridSize.width(), gridSize.height())
-            text = group.name if group.name else ""
-            self._groupsGrid.addItemCore(pixmap, text, group)
+        self._groupsGrid.beginBulkAdd()
+        try:
+            if showNewGroupOption:
+                pixmap = self._getNewGroupPixmap(gridSize.width(), gridSize.height())
+                text = __("New group")
+                self._groupsGrid.addItemCore(pixmap, text, Group())
+
+            for group in groups:
+                pixmap = group.main_face.get_avatar_pixmap(gridSize.width(), gridSize.height())
+                text = group.name if group.name else ""
+                self._groupsGrid.addItemCore(pixmap, text, group)
+        finally:
+            self._groupsGrid.endBulkAdd()
 
     def _onSearchTextChanged(self, text: str) -> None:
         """
@@ -125,9 +130,7 @@ class GroupSelector(QtWidgets.QDialog):
         Returns:
             QPixmap: The pixmap.
         """
-        pixmap = QtGui.QPixmap("res/img/add.png")
-        pixmap = pixmap.scaled(width, height, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-        return pixmap
+        return resources.scaled_pixmap("res/img/add.png", width, height)
 
     @staticmethod
     def getGroup(groups: list[Group], parent: QtWidgets.QWidget = None,
@@ -230,15 +233,19 @@ class MultiGroupSelector(QtWidgets.QDialog):
         """
         self._groupsGrid.clear()
 
-        for group in self._groups:
-            item = QtWidgets.QListWidgetItem()
-            item.setText(group.name)
-            item.setData(QtCore.Qt.UserRole, group)
-            w, h = self._groupsGrid.iconSize().width(), self._groupsGrid.iconSize().height()
-            item.setIcon(QtGui.QIcon(group.main_face.get_avatar_pixmap(w, h)))
-            item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
-            item.setCheckState(QtCore.Qt.Unchecked)
-            self._groupsGrid.addItem(item)
+        w, h = self._groupsGrid.iconSize().width(), self._groupsGrid.iconSize().height()
+        self._groupsGrid.beginBulkAdd()
+        try:
+            for group in self._groups:
+                item = QtWidgets.QListWidgetItem()
+                item.setText(group.name)
+                item.setData(QtCore.Qt.UserRole, group)
+                item.setIcon(QtGui.QIcon(group.main_face.get_avatar_pixmap(w, h)))
+                item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
+                item.setCheckState(QtCore.Qt.Unchecked)
+                self._groupsGrid.addItem(item)
+        finally:
+            self._groupsGrid.endBulkAdd()
 
     def _onSearchTextChanged(self, text: str) -> None:
         """
@@ -4,6 +4,7 @@ from ..Workspace import Workspace
 from .ClusteringService import find_merge_oportunities, MergeOportunity
 from ..Widgets.PixmapDisplay import PixmapDisplay
 from ..Models import Group
+from .. import resources
 from ..l10n import __
 
 
@@ -22,8 +23,7 @@ class _IconButton(QtWidgets.QPushButton):
         layout = QtWidgets.QVBoxLayout()
         layout.setContentsMargins(5, 5, 5, 5)
         self._icon = QtWidgets.QLabel()
-        size = QtCore.QSize(32, 32)
-        self._icon.setPixmap(QtGui.QPixmap(iconPath).scaled(size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
+        self._icon.setPixmap(resources.scaled_pixmap(iconPath, 32, 32))
         self._icon.setAlignment(QtCore.Qt.AlignCenter)
         self._icon.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         self._text = QtWidgets.QLabel(text)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from time import perf_counter_ns
 
+import cv2
 import dlib
 import numpy as np
 
@@ -37,31 +38,64 @@ class ImageProcessor:
         self._face_encoder = dlib.face_recognition_model_v1(self._path_encoder)
         self._shape_predictor = dlib.shape_predictor(self._path_shape_68p)
         self.predictor_jitter = 0
+        # Images whose downscaled Laplacian variance is below this value are considered
+        # flat (solid colors, gradients, blank scans) and skip the face detector entirely.
+        # Set to 0 to always run the detector.
+        self.min_detail_variance = 1.0
 
-    def _process_face(self, image_rgb: dlib.array, face_rect: dlib.rectangle, confidence: float) -> Face:
+    def _process_faces(self, image_rgb: dlib.array, detections: dlib.rectangles, scores: list[float]) -> list[Face]:
         """
-        Process a single face in an image and returns a Face object.
+        Process all the detected faces in an image and returns a list of Face objects.
+        The face descriptors are computed in a single batched call and converted to
+        a contiguous (N, 128) matrix once, instead of once per face.
 
         Args:
             image_rgb (dlib.array): The image in RGB format.
-            face_rect (dlib.rectangle): The face rectangle.
-            confidence (float): The face detection confidence score.
+            detections (dlib.rectangles): The face rectangles.
+            scores (list[float]): The face detection confidence scores.
 
         Returns:
-            The processed face.
+            The processed faces.
         """
+        if len(detections) == 0:
+            return []
+
         # Detect the face landmarks.
-        shape = self._shape_predictor(image_rgb, face_rect)
-        encoding = self._face_encoder.compute_face_descriptor(image_rgb, shape, self.predictor_jitter)
-
-        # Return the face.
-        face = Face()
-        x, y = face_rect.left(), face_rect.top()
-        w, h = face_rect.right() - x, face_rect.bottom() - y
-        face.aabb = Rect(x, y, w, h)
-        face.encoding = np.array(encoding)
-        face.confidence = confidence
-        return face
+        shapes = dlib.full_object_detections()
+        for face_rect in detections:
+            shapes.append(self._shape_predictor(image_rgb, face_rect))
+
+        # The project file stores the encodings as float64, so keep dlib's native precision.
+        descriptors = self._face_encoder.compute_face_descriptor(image_rgb, shapes, self.predictor_jitter)
+        encodings = np.array(descriptors, dtype=np.float64).reshape(len(detections), 128)
+
+        faces = []
+        for face_rect, confidence, encoding in zip(detections, scores, encodings):
+            face = Face()
+            x, y = face_rect.left(), face_rect.top()
+            w, h = face_rect.right() - x, face_rect.bottom() - y
+            face.aabb = Rect(x, y, w, h)
+            face.encoding = encoding
+            face.confidence = confidence
+            faces.append(face)
+        return faces
+
+    def _has_detail(self, image_rgb: np.ndarray) -> bool:
+        """
+        Cheap pre-filter that checks if an image has enough detail to possibly contain a face.
+
+        Args:
+            image_rgb (np.ndarray): The image in RGB format.
+
+        Returns:
+            True if the face detector should be run on the image.
+        """
+        if self.min_detail_variance <= 0:
+            return True
+
+        small = cv2.resize(image_rgb, (64, 64), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_RGB2GRAY)
+        return cv2.Laplacian(gray, cv2.CV_32F).var() >= self.min_detail_variance
 
     def process(self, image_rgb: dlib.array) -> ImageProcessorResult:
         """
@@ -72,8 +106,10 @@ class ImageProcessor:
         """
         t = perf_counter_ns()
 
-        detections, scores, _ = self._face_detector.run(image_rgb)
-        faces = [self._process_face(image_rgb, face, score) for face, score in zip(detections, scores)]
+        faces = []
+        if self._has_detail(image_rgb):
+            detections, scores, _ = self._face_detector.run(image_rgb)
+            faces = self._process_faces(image_rgb, detections, scores)
 
         time = perf_counter_ns() - t
         return ImageProcessorResult(faces, time)
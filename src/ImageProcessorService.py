@@ -1,3 +1,4 @@
+import collections
 import multiprocessing
 import queue
 import threading
@@ -60,12 +61,12 @@ class _Worker(multiprocessing.Process):
 
         Args:
             input_queue (multiprocessing.Queue): The input queue.
-            event_queue (multiprocessing.Queue): The event queue.
+            event_queue (multiprocessing.SimpleQueue): The event queue.
         """
         super().__init__(*args, **kwargs)
         self.daemon = True
         self._input_queue = input_queue  # type: multiprocessing.Queue[_WorkerTask]
-        self._event_queue = event_queue  # type: multiprocessing.Queue[_WorkerEvent]
+        self._event_queue = event_queue  # type: multiprocessing.SimpleQueue[_WorkerEvent]
         self._image_processor = None  # This is lazy initialized because dlib cannot be pickled.
         self.max_idle_time = 10  # seconds
 
@@ -113,7 +114,7 @@ class ImageProcessorService:
     using multiprocessing. The class is not thread safe and should be only used from the UI thread.
     """
 
-    def __init__(self, max_workers: int = None) -> None:
+    def __init__(self, max_workers: int = None, max_queued_tasks: int = 32) -> None:
         """
         Initializes a new instance of the ImageProcessingService class.
         The service is not started by default. Call start() to start the service.
@@ -121,12 +122,23 @@ class ImageProcessorService:
         Args:
             max_workers (int): The maximum number of workers to use. If None, the number of workers
                 is equal to the number of CPU cores.
+            max_queued_tasks (int): The maximum number of images that are sent to the workers at
+                the same time. The rest of the images wait in a backlog until a worker finishes.
         """
         super().__init__()
         self._input_queue = multiprocessing.Queue()
-        self._event_queue = multiprocessing.Queue()
+        # The event queue is only drained by a single thread and never needs timeouts or
+        # qsize(), so the lighter SimpleQueue (no feeder thread, no buffer) is enough.
+        self._event_queue = multiprocessing.SimpleQueue()
         self._requests: dict[UUID, _ImageProcessingRequest] = {}  # Used for O(1) mapping from the WorkerEvent to the Image
         self._image_to_id: dict[Image, UUID] = {}  # Used for O(1) lookup for duplicated tasks
+        # Every task sent to the input queue carries a full copy of the pixels, so only a bounded
+        # number of tasks are in flight. The backlog only holds the request ids, and the pixels are
+        # copied when a worker finishes a task and the next request is sent.
+        self._max_queued_tasks = max_queued_tasks
+        self._queued_tasks_count = 0
+        self._backlog = collections.deque()  # type: collections.deque[UUID]
+        self._backlog_lock = threading.Lock()
         self._workers = []  # type: list[_Worker]
         self._max_workers = max_workers or multiprocessing.cpu_count()
         self._is_running = False
@@ -141,17 +153,32 @@ class ImageProcessorService:
             request = self._requests[event.id]
             del self._requests[event.id]
             del self._image_to_id[request.image]
+            self._send_next_task()
 
             if isinstance(event, _WorkerSuccessEvent):
                 image = request.image
                 image.clear_faces()
                 for face in event.result.faces:
                     image.add_face(face)
-                image._processed = True
+                image.processed = True
                 request.success(image)
             elif isinstance(event, _WorkerFailureEvent):
                 request.failure(event.error, request.image)
 
+    def _send_task(self, request: _ImageProcessingRequest) -> None:
+        self._input_queue.put(_WorkerTask(request.id, request.image.get_pixels_rgb()))
+
+    def _send_next_task(self) -> None:
+        """
+        Called when a task leaves the input queue. Sends the next request in the backlog, if any.
+        """
+        with self._backlog_lock:
+            if len(self._backlog) == 0:
+                self._queued_tasks_count -= 1
+                return
+            id = self._backlog.popleft()
+        self._send_task(self._requests[id])
+
     def _addWorker(self) -> None:
         i = len(self._workers)
         name = "ImageFeaturesServiceWorker-{}".format(i)
@@ -242,8 +269,16 @@ class ImageProcessorService:
         # This id is used to comunicate with the worker process.
         id = uuid.uuid4()
         self._image_to_id[image] = id
-        self._requests[id] = _ImageProcessingRequest(id, image, success, failure)
-        self._input_queue.put(_WorkerTask(id, image.get_pixels_rgb()))
+        request = _ImageProcessingRequest(id, image, success, failure)
+        self._requests[id] = request
+        with self._backlog_lock:
+            can_send = self._queued_tasks_count < self._max_queued_tasks
+            if can_send:
+                self._queued_tasks_count += 1
+            else:
+                self._backlog.append(id)
+        if can_send:
+            self._send_task(request)
         self._addWorkerIfNeeded()
 
     def __del__(self):
@@ -251,9 +286,9 @@ class ImageProcessorService:
 
     def queue_size(self) -> int:
         """
-        Returns the number of images in the queue.
+        Returns the number of images in the queue, including the ones waiting in the backlog.
         """
-        return self._input_queue.qsize()
+        return self._input_queue.qsize() + len(self._backlog)
 
     def pending_images_count(self) -> int:
         """
@@ -273,5 +308,13 @@ class ImageProcessorService:
         """
         Removes all images from the queue. No callbacks are invoked.
         """
+        with self._backlog_lock:
+            ids = list(self._backlog)
+            self._backlog.clear()
         while not self._input_queue.empty():
-            self._input_queue.get()
+            ids.append(self._input_queue.get().id)
+            with self._backlog_lock:
+                self._queued_tasks_count -= 1
+        for id in ids:
+            request = self._requests.pop(id)
+            del self._image_to_id[request.image]
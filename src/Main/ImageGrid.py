@@ -1,12 +1,207 @@
+import logging
+import os
+from typing import Any
+
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from .. import resources
 from ..Application import Application
 from ..l10n import __
 from ..Models import Image
-from ..Widgets.GridBase import GridBase
+from ..Widgets.GridBase import GridBase, GridItemDelegate, SizePreset, scaledPixmap
+
+
+class ImageGridModel(QtCore.QAbstractListModel):
+    """
+    A list model that exposes a list of images. The thumbnails are only prepared when the
+    view requests the decoration of a row, so only the visible images are ever converted.
+    """
+
+    # Used to send the thumbnails prepared in the worker threads back to the main thread.
+    _thumbnailReady = QtCore.Signal(object, QtGui.QImage)  # (Image, QImage)
+
+    # The thumbnails are prepared once at the biggest icon size, so changing the size preset
+    # only needs to downscale the already small thumbnails.
+    _thumbnailSize = GridBase.hugePreset.iconSize
+
+    def __init__(self, parent: QtCore.QObject = None) -> None:
+        """
+        Initializes a new instance of the ImageGridModel class.
+
+        Args:
+            parent (QObject): The parent object.
+        """
+        super().__init__(parent)
+        self._images = []  # type: list[Image]
+        self._rows = {}  # type: dict[Image, int]  # Used for O(1) lookup of the row of an image
+        self._thumbnailKeys = {}  # type: dict[Image, str]
+        self._pendingThumbnails = set()  # type: set[Image]
+        self._failedThumbnails = set()  # type: set[Image]  # Never requested again, a placeholder is shown instead
+        self._iconSize = QtCore.QSize()
+        self._thumbnailReady.connect(self._onThumbnailReady)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._images)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        image = self._images[index.row()]
+        Role = QtCore.Qt.ItemDataRole
+        if role == Role.DisplayRole or role == Role.ToolTipRole or role == Role.StatusTipRole:
+            return image.display_name
+        elif role == Role.DecorationRole:
+            return self._icon(image)
+        elif role == Role.UserRole:
+            return image
+        elif role == Role.TextAlignmentRole:
+            return QtCore.Qt.AlignmentFlag.AlignHCenter | QtCore.Qt.AlignmentFlag.AlignBottom
+        return None
+
+    def images(self) -> list[Image]:
+        """
+        Gets the images in the model.
+        """
+        return self._images
+
+    def image(self, row: int) -> Image:
+        """
+        Gets the image at the given row.
+        """
+        return self._images[row]
+
+    def indexOf(self, image: Image) -> QtCore.QModelIndex:
+        """
+        Gets the model index of the given image, or an invalid index if the image is not in the model.
+        """
+        row = self._rows.get(image)
+        return self.index(row, 0) if row is not None else QtCore.QModelIndex()
+
+    def setIconSize(self, size: QtCore.QSize) -> None:
+        """
+        Sets the size of the icons returned for the decoration role.
+        """
+        if size == self._iconSize:
+            return
+        self._iconSize = QtCore.QSize(size)
+        if len(self._images) > 0:
+            Role = QtCore.Qt.ItemDataRole
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._images) - 1, 0), [Role.DecorationRole])
+
+    def addImages(self, images: list[Image]) -> None:
+        """
+        Appends the given images to the model.
+        """
+        if len(images) == 0:
+            return
+        first = len(self._images)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(images) - 1)
+        self._images.extend(images)
+        for row, image in enumerate(images, first):
+            self._rows[image] = row
+        self.endInsertRows()
+
+    def removeImage(self, image: Image) -> None:
+        """
+        Removes the given image from the model.
+        """
+        row = self._rows.get(image)
+        if row is None:
+            return
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        self._images.pop(row)
+        del self._rows[image]
+        for i in range(row, len(self._images)):  # The following rows move up
+            self._rows[self._images[i]] = i
+        self._thumbnailKeys.pop(image, None)
+        self._failedThumbnails.discard(image)
+        self.endRemoveRows()
+
+    def clear(self) -> None:
+        """
+        Removes all the images from the model.
+        """
+        self.beginResetModel()
+        self._images = []
+        self._rows.clear()
+        self._thumbnailKeys.clear()
+        self._failedThumbnails.clear()
+        self.endResetModel()
+
+    def _icon(self, image: Image) -> QtGui.QIcon:
+        if image in self._failedThumbnails:
+            return resources.icon("res/img/image.png")
+
+        thumbnail = QtGui.QPixmapCache.find(self._thumbnailKey(image))
+        if thumbnail is None or thumbnail.isNull():
+            self._requestThumbnail(image)
+            return None
+
+        # The scaled pixmap is stored in the QPixmapCache, so only the visible thumbnails stay in memory.
+        return QtGui.QIcon(scaledPixmap(thumbnail, self._iconSize))
+
+    def _thumbnailKey(self, image: Image) -> str:
+        """
+        Gets the QPixmapCache key of the thumbnail of an image. Images stored on disk are keyed
+        by their path and modification time, so the thumbnails survive reopening the project
+        and are refreshed when the file changes.
+        """
+        key = self._thumbnailKeys.get(image)
+        if key is not None:
+            return key
+
+        size = self._thumbnailSize
+        if image.path:
+            try:
+                mtime = os.path.getmtime(image.path)
+            except OSError:
+                mtime = 0
+            key = f"thumbnail:{image.path}:{mtime}:{size.width()}x{size.height()}"
+        else:
+            key = f"thumbnail:{image.id}:{size.width()}x{size.height()}"
+        self._thumbnailKeys[image] = key
+        return key
+
+    def _requestThumbnail(self, image: Image) -> None:
+        if image in self._pendingThumbnails:
+            return
+        self._pendingThumbnails.add(image)
+        Application.executor().submit(self._prepareThumbnail, image)
+
+    def _prepareThumbnail(self, image: Image) -> None:
+        """
+        Prepares the thumbnail of an image. This method is called from a worker thread, so it
+        only works with QImage. The image is downscaled here, so the grid never holds the
+        full resolution pixmap. The QPixmap is created in the main thread.
+        """
+        try:
+            qimage = image.get_image()
+            size = self._thumbnailSize
+            if qimage.width() > size.width() or qimage.height() > size.height():
+                qimage = qimage.scaled(size, QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                                       QtCore.Qt.TransformationMode.SmoothTransformation)
+            # Converting to the pixmap's native format here makes QPixmap.fromImage() a cheap copy.
+            qimage = qimage.convertToFormat(QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        except Exception as e:
+            logging.warning(f"Error preparing thumbnail for image {image.display_name}: {e}")
+            qimage = QtGui.QImage()
+        self._thumbnailReady.emit(image, qimage)
+
+    @QtCore.Slot(object, QtGui.QImage)
+    def _onThumbnailReady(self, image: Image, qimage: QtGui.QImage) -> None:
+        self._pendingThumbnails.discard(image)
+        index = self.indexOf(image)
+        if not index.isValid():  # The image was removed in the meantime.
+            return
+        if qimage.isNull():  # The thumbnail could not be prepared
+            self._failedThumbnails.add(image)
+        else:
+            QtGui.QPixmapCache.insert(self._thumbnailKey(image), QtGui.QPixmap.fromImage(qimage))
+        self.dataChanged.emit(index, index, [QtCore.Qt.ItemDataRole.DecorationRole])
 
 
-class ImageGrid(GridBase):
+class ImageGrid(QtWidgets.QListView):
     """
     A widget that displays a grid of images.
     """
@@ -25,58 +220,76 @@ class ImageGrid(GridBase):
         Initializes a new instance of the ImageGrid class.
         """
         super().__init__(parent)
-        self._images = []
+        self._model = ImageGridModel(self)
         self._selectedImages = []
-        # self.setGridSize(QtCore.QSize(150, 150))
-        # self.setIconSize(QtCore.QSize(130, 100))
+        self._sizePreset = None  # type: SizePreset
+
+        # Rubber-band and keyboard selections change the selection many times per gesture,
+        # so imageSelectionChanged is only emitted once the selection settles.
+        self._selectionTimer = QtCore.QTimer(self)
+        self._selectionTimer.setSingleShot(True)
+        self._selectionTimer.setInterval(50)
+        self._selectionTimer.timeout.connect(self.imageSelectionChanged)
+
+        self.setModel(self._model)
+        self.setContentsMargins(0, 0, 0, 0)
+        self.setViewMode(QtWidgets.QListView.ViewMode.IconMode)
+        self.setFlow(QtWidgets.QListView.Flow.LeftToRight)
+        self.setResizeMode(QtWidgets.QListView.ResizeMode.Adjust)
+        self.setMovement(QtWidgets.QListView.Movement.Static)
+        self.setDragDropMode(QtWidgets.QListView.DragDropMode.NoDragDrop)
         self.setSelectionMode(QtWidgets.QListView.SelectionMode.ExtendedSelection)
         self.setSelectionBehavior(QtWidgets.QListView.SelectionBehavior.SelectItems)
         self.setItemDelegate(_TextOverDelegate(self))
+        self.setSizePreset(GridBase.mediumPreset)
 
-        self._loadingIcon = QtGui.QIcon("res/img/loading.png")
-        self._faceIcon = QtGui.QIcon("res/img/person.png")
+        # The badge drawn over each image, indexed by Image.status. The icons are rasterized
+        # once here, so painting a badge is a single pixmap blit.
+        self._badges = [None, None, None]  # type: list[QtGui.QPixmap]
+        self._badges[Image.STATUS_UNPROCESSED] = resources.icon("res/img/loading.png").pixmap(24, 24)
+        self._badges[Image.STATUS_HAS_FACES] = resources.icon("res/img/person.png").pixmap(24, 24)
 
-        self.itemSelectionChanged.connect(self._onItemSelectionChanged)
+        self.selectionModel().selectionChanged.connect(self._onItemSelectionChanged)
         Application.workspace().imageProcessed.connect(self._onImageProcessed)
 
         def onPressed(sinal: QtCore.Signal):
-            image = self._images[self.selectedIndexes()[0].row()]
+            image = self._model.image(self.selectedIndexes()[0].row())
             sinal.emit(image)
 
         # Right-click actions for when a user right-clicks on the image.
         self._menu = QtWidgets.QMenu()
 
         self._perspectiveAction = self._menu.addAction(
-            QtGui.QIcon("res/img/correct_perspective.png"),
+            resources.icon("res/img/correct_perspective.png"),
             __("Correct perspective"),
             lambda: onPressed(self.perspectivePressed))
 
         self._deblurAction = self._menu.addAction(
-            QtGui.QIcon("res/img/deblur.png"),
+            resources.icon("res/img/deblur.png"),
             __("Deblur Filter"),
             lambda: onPressed(self.deblurImagePressed))
 
         self._menu.addSeparator()
 
         self._openInExternalImageViewerAction = self._menu.addAction(
-            QtGui.QIcon("res/img/photo_viewer.png"),
+            resources.icon("res/img/photo_viewer.png"),
             __("Open In External Image Viewer"),
             self._onOpenInExternalImageViewer)
 
         self._openInExplorerAction = self._menu.addAction(
-            QtGui.QIcon("res/img/folder.png"),
+            resources.icon("res/img/folder.png"),
             __("Open In Explorer"),
             self._onOpenInExplorer)
 
         self._menu.addSeparator()
 
         self._exportImagesAction = self._menu.addAction(
-            QtGui.QIcon("res/img/image_save.png"),
+            resources.icon("res/img/image_save.png"),
             __("Export Image"),
             self._onExportImage)
 
         self._removeFromProjectAction = self._menu.addAction(
-            QtGui.QIcon("res/img/times.png"),
+            resources.icon("res/img/times.png"),
             __("Remove from Project"),
             self._onRemoveFromProject)
 
@@ -95,6 +308,27 @@ class ImageGrid(GridBase):
             self._removeFromProjectAction.setEnabled(count > 0)
             self._menu.exec_(event.globalPos())
 
+    def setSizePreset(self, sizePreset: SizePreset) -> None:
+        """
+        Set the size preset.
+
+        Args:
+            sizePreset (SizePreset): The size preset.
+        """
+        self._sizePreset = sizePreset
+        self.setGridSize(sizePreset.gridSize)
+        self.setIconSize(sizePreset.iconSize)
+        self._model.setIconSize(sizePreset.iconSize)
+
+    def sizePreset(self) -> SizePreset:
+        """
+        Get the current size preset.
+
+        Returns:
+            SizePreset: The current size preset.
+        """
+        return self._sizePreset
+
     def addImage(self, image: Image) -> None:
         """
         Adds an image to the grid.
@@ -102,27 +336,34 @@ class ImageGrid(GridBase):
         Args:
             image (Image): The image to add.
         """
-        pixmap = image.get_pixmap()
-        self.addItemCore(pixmap, image.display_name)
-        self._images.append(image)
+        self.addImages([image])
+
+    def addImages(self, images: list[Image]) -> None:
+        """
+        Adds multiple images to the grid. The thumbnails are prepared in background threads
+        once the images become visible, and shown as soon as they are ready.
+
+        Args:
+            images (list[Image]): The images to add.
+        """
+        self._model.addImages(images)
 
     def removeImage(self, image: Image) -> None:
         """
         Removes an image from the grid.
         """
+        self._model.removeImage(image)
+        # Removing rows does not emit selectionChanged, so the removed image is dropped from the
+        # selection here. Several images are usually removed at once, so the signal goes through the timer.
         if image in self._selectedImages:
-            self._selectedImages.remove(image)
-        index = self._images.index(image)
-        if index < 0:
-            return
-        self._images.remove(image)
-        self.takeItem(index)
+            self._selectedImages = [selected for selected in self._selectedImages if selected is not image]
+            self._selectionTimer.start()
 
     def images(self) -> list[Image]:
         """
         Gets the images in the grid.
         """
-        return self._images
+        return self._model.images()
 
     def selectedImages(self) -> list[Image]:
         """
@@ -130,22 +371,26 @@ class ImageGrid(GridBase):
         """
         return self._selectedImages
 
+    @QtCore.Slot()
     def _onItemSelectionChanged(self) -> None:
-        self._selectedImages = []
-        for item in self.selectedIndexes():
-            i = item.row()
-            if i < len(self._images):
-                self._selectedImages.append(self._images[i])
+        images = self._model.images()
+        count = len(images)
+        rows = sorted(index.row() for index in self.selectedIndexes())  # In grid order, not in click order
+        selectedImages = [images[row] for row in rows if row < count]
+        old = self._selectedImages
+        if len(selectedImages) == len(old) and all(a is b for a, b in zip(selectedImages, old)):
+            return  # The selection did not actually change (for example, a focus change).
 
-        self.imageSelectionChanged.emit()
+        self._selectedImages = selectedImages
+        self._selectionTimer.start()
 
     def clear(self) -> None:
         """
         Clears the grid.
         """
-        self._images = []
         self._selectedImages = []
-        super().clear()
+        self._model.clear()
+        self._selectionTimer.stop()
         self.imageSelectionChanged.emit()
 
     @QtCore.Slot(Image)
@@ -153,10 +398,9 @@ class ImageGrid(GridBase):
         """
         Updates the grid when an image is processed.
         """
-        if image not in self._images:
-            return
-        index = self._images.index(image)
-        self.update(self.model().index(index, 0))
+        index = self._model.indexOf(image)
+        if index.isValid():
+            self.update(index)
 
     @QtCore.Slot()
     def _onOpenInExternalImageViewer(self) -> None:
@@ -166,7 +410,7 @@ class ImageGrid(GridBase):
         indexes = self.selectedIndexes()
         if len(indexes) != 1:
             return
-        image = self._images[indexes[0].row()]
+        image = self._model.image(indexes[0].row())
         Application.projectManager().openImageExternally(image)
 
     @QtCore.Slot()
@@ -177,7 +421,7 @@ class ImageGrid(GridBase):
         indexes = self.selectedIndexes()
         if len(indexes) != 1:
             return
-        image = self._images[indexes[0].row()]
+        image = self._model.image(indexes[0].row())
         Application.projectManager().openImageInExplorer(image)
 
     @QtCore.Slot()
@@ -193,32 +437,22 @@ class ImageGrid(GridBase):
         Application.projectManager().exportImages(self, selectedImages)
 
 
-class _TextOverDelegate(QtWidgets.QStyledItemDelegate):
+class _TextOverDelegate(GridItemDelegate):
+    # The badge is drawn at the top left corner of every item.
+    _badgeOffset = QtCore.QPoint(2, 2)
+
     def __init__(self, imageGrid: ImageGrid, parent=None):
         self._imageGrid = imageGrid
-        super().__init__(parent)
-
-    def _getIcon(self, image: Image):
-        if not image._processed:
-            return self._imageGrid._loadingIcon
-        elif len(image.faces) > 0:
-            return self._imageGrid._faceIcon
-        else:
-            return None
+        super().__init__(imageGrid, parent)
 
     def paint(self, painter, option, index):
+        if option.rect.isEmpty():  # Nothing would be visible.
+            return
         super().paint(painter, option, index)
-        itemIndex = index.row()
-        images = self._imageGrid.images()
-        if itemIndex >= len(images):
+        image = index.data(QtCore.Qt.ItemDataRole.UserRole)  # type: Image
+        if image is None:
             return
-        image = images[itemIndex]
-        icon = self._getIcon(image)
-
-        if icon is not None:
-            painter.save()
-            painter.setRenderHint(QtGui.QPainter.Antialiasing)
-            # draw loading icon
-            iconRect = QtCore.QRect(option.rect.x() + 2, option.rect.y() + 2, 24, 24)
-            icon.paint(painter, iconRect)
-            painter.restore()
+        badge = self._imageGrid._badges[image.status]
+
+        if badge is not None:
+            painter.drawPixmap(option.rect.topLeft() + self._badgeOffset, badge)
@@ -213,8 +213,7 @@ class ProjectExplorerPage(QtWidgets.QWidget, NavigationPage):
 
     @QtCore.Slot(list)
     def _onImagesAdded(self, images: list[Image]) -> None:
-        for image in images:
-            self._imageGrid.addImage(image)
+        self._imageGrid.addImages(images)
         self._onNumberOfImagesChanged()
 
     @QtCore.Slot(list)
@@ -226,9 +225,7 @@ class ProjectExplorerPage(QtWidgets.QWidget, NavigationPage):
     @QtCore.Slot()
     def _onProjectChanged(self) -> None:
         self._imageGrid.clear()
-        images = self._workspace.project().images
-        for image in images:
-            self._imageGrid.addImage(image)
+        self._imageGrid.addImages(self._workspace.project().images)
         self._onNumberOfImagesChanged()
 
     def _onNumberOfImagesChanged(self) -> None:
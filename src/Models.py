@@ -1,4 +1,5 @@
 import hashlib
+import itertools
 import os
 from dataclasses import dataclass
 from typing import Any, Sequence
@@ -322,6 +323,15 @@ class Image(Model):
     _data: "ImageData" = None
     """The raw image data."""
 
+    STATUS_NO_FACES = 0
+    """The image has been processed and no faces were found."""
+
+    STATUS_UNPROCESSED = 1
+    """The image has not been processed by the face detector yet."""
+
+    STATUS_HAS_FACES = 2
+    """The image has been processed and contains at least one face."""
+
     def __init__(self, path: str = None, id: UUID = None, raw_rgba: np.ndarray = None) -> None:
         """
         Initializes the Image class. The image is NOT loaded into memory until you call
@@ -339,6 +349,7 @@ class Image(Model):
         self._raw_image = raw_rgba
         self._faces: "list[Face]" = []
         self._processed: bool = False
+        self._status: int = Image.STATUS_UNPROCESSED
         self.original_path = path
         self._data = None if raw_rgba is None else ImageData(raw_rgba)
 
@@ -357,6 +368,18 @@ class Image(Model):
 
         self._data = ImageData.from_file(self.path)
 
+    def load_from_bytes(self, file_bytes: bytes) -> None:
+        """
+        Loads the image into memory from the contents of its file, when they were already read.
+
+        Args:
+            file_bytes (bytes): The raw bytes of the image file, as returned by read_file_bytes().
+        """
+        if self._data is not None:
+            return
+
+        self._data = ImageData.from_bytes(file_bytes)
+
     def unload(self) -> None:
         """
         Unloads the image from memory.
@@ -376,6 +399,23 @@ class Image(Model):
         Sets whether or not the image has been processed by the face detector.
         """
         self._processed = value
+        self._update_status()
+
+    @property
+    def status(self) -> int:
+        """
+        Gets the processing status of the image. One of the Image.STATUS_* constants.
+        The status is precomputed when the image changes, so it is cheap to read while painting.
+        """
+        return self._status
+
+    def _update_status(self) -> None:
+        if not self._processed:
+            self._status = Image.STATUS_UNPROCESSED
+        elif len(self._faces) > 0:
+            self._status = Image.STATUS_HAS_FACES
+        else:
+            self._status = Image.STATUS_NO_FACES
 
     @property
     def is_virtual(self) -> bool:
@@ -407,7 +447,7 @@ class Image(Model):
         """
         Gets whether or not the image is loaded into memory.
         """
-        return self._raw_image is not None
+        return self._data is not None
 
     @property
     def faces(self) -> list[Face]:
@@ -421,6 +461,7 @@ class Image(Model):
         Removes all faces from the image.
         """
         self._faces.clear()
+        self._update_status()
 
     def add_face(self, face: Face):
         """
@@ -428,6 +469,7 @@ class Image(Model):
         """
         self._faces.append(face)
         face.image = self
+        self._update_status()
 
     def remove_face(self, face: Face):
         """
@@ -435,6 +477,7 @@ class Image(Model):
         """
         self._faces.remove(face)
         face.image = None
+        self._update_status()
 
     def read_file_bytes(self) -> bytes:
         """
@@ -444,11 +487,15 @@ class Image(Model):
         with open(self.path, "rb") as file:
             return file.read()
 
-    def compute_hashes(self) -> None:
+    def compute_hashes(self, file_bytes: bytes = None) -> None:
         """
         Recomputes the hashes of the image file.
+
+        Args:
+            file_bytes (bytes): The raw bytes of the image file, if they were already read.
+                If None, the file is read from disk. Defaults to None.
         """
-        bytes = self.read_file_bytes()
+        bytes = file_bytes if file_bytes is not None else self.read_file_bytes()
 
         self.hashes = {}
         self.hashes["md5"] = hashlib.md5(bytes).hexdigest()
@@ -497,11 +544,29 @@ class Image(Model):
         """
         return self.data().get_image()
 
-    def get_pixmap(self) -> QtGui.QPixmap:
+    def get_pixmap(self, prepared: QtGui.QImage = None) -> QtGui.QPixmap:
         """
         Returns a QPixmap of the image.
+
+        Args:
+            prepared (QImage): The image returned by prepare_pixmap_image(), if it was
+                already prepared in a worker thread. Defaults to None.
+        """
+        return self.data().get_pixmap(prepared)
+
+    def find_pixmap(self) -> QtGui.QPixmap:
+        """
+        Returns the QPixmap of the image if it is already available without any conversion,
+        or None otherwise. The image is never loaded by this method.
+        """
+        return self._data.find_pixmap() if self._data is not None else None
+
+    def prepare_pixmap_image(self) -> QtGui.QImage:
+        """
+        Loads the image if needed and converts it to the native pixmap format. This method can
+        be called from a worker thread. Pass the result to get_pixmap() in the main thread.
         """
-        return self.data().get_pixmap()
+        return self.data().prepare_pixmap_image()
 
     def get_pixels_rgb(self) -> np.ndarray:
         """
@@ -528,8 +593,13 @@ class ImageData:
     """
     _raw_image: np.ndarray = None
 
+    _pixmap_key_counter = itertools.count()
+
     def __init__(self, raw_image_rgba: np.ndarray) -> None:
         self._raw_image = raw_image_rgba
+        # Unique key of the QPixmap of this image in the QPixmapCache. A counter is used instead
+        # of id() because ids can be reused once the object is garbage collected.
+        self._pixmap_key = f"image_data:{next(ImageData._pixmap_key_counter)}"
 
     @staticmethod
     def from_file(path: str) -> "ImageData":
@@ -600,11 +670,35 @@ class ImageData:
         """
         return QtGui.QImage(self._raw_image.data, self.width, self.height, QtGui.QImage.Format_RGBA8888)
 
-    def get_pixmap(self) -> QtGui.QPixmap:
+    def get_pixmap(self, prepared: QtGui.QImage = None) -> QtGui.QPixmap:
         """
-        Returns a QPixmap of the image.
+        Returns a QPixmap of the image. The pixmap is kept in the QPixmapCache, so repeated
+        calls (for example, one per face of the image) do not convert the raw data again.
+        The raw data never changes, so the cached pixmap never needs to be invalidated.
+
+        Args:
+            prepared (QImage): The image returned by prepare_pixmap_image(), if it was
+                already prepared in a worker thread. Defaults to None.
         """
-        return QtGui.QPixmap(self.get_image())
+        pixmap = self.find_pixmap()
+        if pixmap is None:
+            pixmap = QtGui.QPixmap.fromImage(prepared if prepared is not None else self.get_image())
+            QtGui.QPixmapCache.insert(self._pixmap_key, pixmap)
+        return pixmap
+
+    def find_pixmap(self) -> QtGui.QPixmap:
+        """
+        Returns the cached QPixmap of the image, or None if it is not in the QPixmapCache.
+        """
+        pixmap = QtGui.QPixmapCache.find(self._pixmap_key)
+        return None if pixmap is None or pixmap.isNull() else pixmap
+
+    def prepare_pixmap_image(self) -> QtGui.QImage:
+        """
+        Returns a copy of the image converted to the native pixmap format, so converting it
+        to a QPixmap is a cheap copy. This method is thread safe.
+        """
+        return self.get_image().convertToFormat(QtGui.QImage.Format.Format_ARGB32_Premultiplied)
 
     def get_pixels_rgb(self) -> np.ndarray:
         """
@@ -718,15 +812,32 @@ class Project:
 
     def add_face_to_best_group(self, face: Face):
         """Adds a face to the best group."""
-        if face.group is not None:
+        self.add_faces_to_best_groups([face])
+
+    def add_faces_to_best_groups(self, faces: Sequence[Face]):
+        """
+        Adds each face to its best group, or to a new group if no group is close enough.
+        The faces are added one after the other, so a face can join the group created for a previous face.
+        """
+        faces = [face for face in faces if face.group is None]
+        if len(faces) == 0:
             return
-        from .GroupFaces.ClusteringService import find_best_group
-        group = find_best_group(face, self._groups)
-        if group is None:
-            group = Group()
-            self.add_group(group)
-        group.add_face(face)
-        group.recompute_centroid()
+        from .GroupFaces.ClusteringService import find_best_group_index, stack_centroids  # Avoid circular imports
+        # The centroids are stacked once, and only the row of the group that changed is updated after each face.
+        centroids = stack_centroids(self._groups)
+        for face in faces:
+            index = find_best_group_index(face, centroids)
+            if index is None:
+                group = Group()
+                self.add_group(group)
+                group.add_face(face)
+                group.recompute_centroid()
+                centroids = np.vstack((centroids, group.centroid)) if len(centroids) > 0 else stack_centroids([group])
+            else:
+                group = self._groups[index]
+                group.add_face(face)
+                group.recompute_centroid()
+                centroids[index] = group.centroid
 
     @property
     def groups(self) -> Sequence[Group]:
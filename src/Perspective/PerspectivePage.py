@@ -306,7 +306,7 @@ class PerspectivePage(QtWidgets.QWidget, NavigationPage):
         interpolation = self._interpolationMode.currentData()
         outputShape = self._computeOutputShape()
         outputBuffer = np.zeros(outputShape, dtype=np.uint8)
-        perspective_transform(self._image.get_pixels_rgba(), outputBuffer, self._points, interpolation)
+        perspective_transform(self._image.get_pixels_rgba(), outputBuffer, self._points, interpolation, use_opencl=True)
 
         return Image(raw_rgba=outputBuffer)
 
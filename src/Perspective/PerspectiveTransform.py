@@ -3,7 +3,8 @@ import numpy as np
 
 
 def perspective_transform(src_image: cv2.Mat, dst_image: cv2.Mat,
-                          src_points: list[(int, int)], interpolation_mode: int = None) -> None:
+                          src_points: list[(int, int)], interpolation_mode: int = None,
+                          use_opencl: bool = False) -> None:
     """
     Transforms the perspective of a source image to a destination image.
     The source and destination buffers should be in BGRA format.
@@ -15,6 +16,10 @@ def perspective_transform(src_image: cv2.Mat, dst_image: cv2.Mat,
         interpolation_mode (int, optional): The interpolation mode to use. Defaults to None.
             Possible values are any openCV supported interpolation modes: cv2.INTER_NEAREST,
             cv2.INTER_LINEAR, cv2.INTER_AREA, cv2.INTER_CUBIC, cv2.INTER_LANCZOS4
+        use_opencl (bool, optional): Whether to run the warp through OpenCV's transparent API (UMat),
+            so it can use an OpenCL device. The source image is uploaded to the device and the result
+            downloaded on every call, so this is only worth it for one-shot full size transforms,
+            not for interactive previews. Defaults to False.
     """
     if len(src_points) != 4:
         raise ValueError("src_points must have exactly 4 points")
@@ -27,4 +32,14 @@ def perspective_transform(src_image: cv2.Mat, dst_image: cv2.Mat,
 
     matrix = cv2.getPerspectiveTransform(src_points, dst_points)
     flags = interpolation_mode if interpolation_mode is not None else cv2.INTER_LINEAR
+
+    if use_opencl and cv2.ocl.useOpenCL():
+        try:
+            result = cv2.warpPerspective(cv2.UMat(src_image), matrix, (dst_w, dst_h), flags=flags)
+            # Callers read the result from the dst buffer, so copy it back from the device.
+            dst_image[...] = result.get()
+            return dst_image
+        except cv2.error:  # The OpenCL device failed, fall back to the CPU
+            pass
+
     return cv2.warpPerspective(src_image, matrix, (dst_w, dst_h), dst_image, flags=flags)
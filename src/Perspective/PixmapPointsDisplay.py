@@ -1,3 +1,4 @@
+import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from ..Widgets.PixmapDisplay import PixmapDisplay
@@ -14,6 +15,12 @@ class PixmapPointsDisplay(PixmapDisplay):
     finished = QtCore.Signal()
     """Emited when the user has finished editing the points."""
 
+    _sourceImage: QtGui.QImage = None  # The pixmap as a QImage, used to draw the zoom rect
+
+    _staticLayerPixmap: QtGui.QPixmap = None
+
+    _staticLayerKey: tuple = None
+
     def __init__(self, parent: QtWidgets.QWidget = None, pixmap: QtGui.QPixmap = None):
         """
         Initializes the PixmapPreview class.
@@ -23,7 +30,9 @@ class PixmapPointsDisplay(PixmapDisplay):
         self.setMinimumWidth(200)
         self.setMouseTracking(True)
         self._pointsImageSpace = []  # type: list[QtCore.QPoint]
-        self._pointsWidgetSpace = []  # type: list[QtCore.QPoint]
+        self._pointsWidgetSpace = []  # type: list[QtCore.QPoint]  # Mapped from _pointsImageSpace by _syncPoints()
+        self._pointsWidgetSpaceArr = np.empty((0, 2), dtype=np.int32)  # Same as _pointsWidgetSpace, for hit testing
+        self._cachedImageToWidget = None  # type: QtGui.QTransform
 
         self._cursorPoint = None  # type: QtCore.QPoint
         self._hasFinished = False
@@ -52,7 +61,7 @@ class PixmapPointsDisplay(PixmapDisplay):
         """
         point = self._clampToImage(point)
         self._pointsImageSpace.append(point)
-        self._pointsWidgetSpace.append(self.imageToWidgetTransform().map(point))
+        self._syncPoints()
         self.pointsChanged.emit()
         self.update()
 
@@ -64,10 +73,35 @@ class PixmapPointsDisplay(PixmapDisplay):
             return
         point = self._clampToImage(point)
         self._pointsImageSpace[index] = point
-        self._pointsWidgetSpace[index] = self.imageToWidgetTransform().map(point)
+        self._syncPoints()
         self.pointsChanged.emit()
         self.update()
 
+    def setPixmap(self, pixmap: QtGui.QPixmap) -> None:
+        """
+        Sets the pixmap to display.
+
+        Args:
+            pixmap (QPixmap): The pixmap to display.
+        """
+        super().setPixmap(pixmap)
+        self._cachedImageToWidget = None
+        # The zoom rect is drawn on every mouse move. Drawing it from a premultiplied QImage
+        # uses the raster engine fast path instead of converting the pixmap region every time.
+        self._sourceImage = None
+        if pixmap is not None:
+            self._sourceImage = pixmap.toImage().convertToFormat(QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+
+    def _imageToWidget(self) -> QtGui.QTransform:
+        """
+        Gets the transform from image space to widget space. The transform is cached until the image
+        rectangle changes, so dragging a point does not go through _processDirty() on every move.
+        """
+        transform = self._cachedImageToWidget
+        if transform is None:
+            transform = self._cachedImageToWidget = self.imageToWidgetTransform()
+        return transform
+
     def removePoint(self, index: int):
         """
         Removes a point.
@@ -75,7 +109,7 @@ class PixmapPointsDisplay(PixmapDisplay):
         if index < 0 or index >= len(self._pointsImageSpace):
             return
         self._pointsImageSpace.pop(index)
-        self._pointsWidgetSpace.pop(index)
+        self._syncPoints()
         self.pointsChanged.emit()
         self.update()
 
@@ -84,7 +118,7 @@ class PixmapPointsDisplay(PixmapDisplay):
         Clears the points.
         """
         self._pointsImageSpace.clear()
-        self._pointsWidgetSpace.clear()
+        self._syncPoints()
         self._hasFinished = False
         self.pointsChanged.emit()
         self.update()
@@ -110,15 +144,71 @@ class PixmapPointsDisplay(PixmapDisplay):
         super().imageRectChangedEvent(imageRect)
 
         # Recompute the points in widget space
-        transform = self.imageToWidgetTransform()
-        self._pointsWidgetSpace = [transform.map(point) for point in self._pointsImageSpace]
+        self._cachedImageToWidget = self.imageToWidgetTransform()
+        self._syncPoints()
+
+    def _syncPoints(self) -> None:
+        """
+        Recomputes the widget space points from the image space points, which are the only
+        source of truth, and the (N, 2) array of widget space points used for hit testing.
+        """
+        # All the points are mapped in a single map() call
+        self._pointsWidgetSpace = list(self._imageToWidget().map(QtGui.QPolygon(self._pointsImageSpace)))
+        coords = [(point.x(), point.y()) for point in self._pointsWidgetSpace]
+        self._pointsWidgetSpaceArr = np.array(coords, dtype=np.int32).reshape(-1, 2)
+        self._invalidateStaticLayer()  # The points are drawn in the static layer
 
     def paintEvent(self, event: QtGui.QPaintEvent):
         """
         Paints the widget.
         """
-        super().paintEvent(event)
+        # The image, the polygon and the points are cached in a layer, so a mouse move only
+        # blits the dirty region of the layer and draws the parts that follow the cursor.
+        if self._isDirty:
+            self._processDirty()
         painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._staticLayer())
+
+        points = self._pointsWidgetSpace
+        if not self._hasFinished and len(points) > 0 and self._cursorPoint is not None:
+            # Invert colors (AA not suported in raster XOR mode)
+            painter.setCompositionMode(QtGui.QPainter.CompositionMode.RasterOp_SourceXorDestination)
+            painter.setPen(self._editingLinePen)
+            painter.drawLine(points[-1], self._cursorPoint)
+            painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_SourceOver)
+            # Keep the last point over the line
+            lastIndex = len(points) - 1
+            painter.setPen(self._highlightedPointPen if lastIndex == self._hightlightedPointIndex else self._pointsPen)
+            painter.drawPoint(points[-1])
+
+        if not self._hasFinished or self._draggedPointIndex != -1:
+            self._drawZoomRect(painter)
+
+    def _invalidateStaticLayer(self) -> None:
+        """
+        Discards the cached layer with the image, the polygon and the points.
+        """
+        self._staticLayerPixmap = None
+
+    def _staticLayer(self) -> QtGui.QPixmap:
+        """
+        Gets a pixmap of the size of the widget with everything that does not depend on the cursor
+        position: the image, the polygon and the points. The pixmap is rendered again only when
+        it was invalidated or the image placement changed.
+        """
+        resizedKey = self._resizedPixmap.cacheKey() if self._resizedPixmap is not None else None
+        imageRect = self._imageRect.getRect() if self._imageRect is not None else None
+        key = (resizedKey, imageRect, self.width(), self.height(), self.devicePixelRatioF())
+        if self._staticLayerPixmap is not None and key == self._staticLayerKey:
+            return self._staticLayerPixmap
+
+        ratio = self.devicePixelRatioF()
+        layer = QtGui.QPixmap(self.size() * ratio)
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(QtCore.Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(layer)
+        if self._resizedPixmap is not None:
+            painter.drawPixmap(self._imageRect, self._resizedPixmap)
 
         points = self._pointsWidgetSpace
 
@@ -134,20 +224,21 @@ class PixmapPointsDisplay(PixmapDisplay):
         elif len(points) > 0:
             painter.setPen(self._editingLinePen)
             painter.drawPolyline(points)
-            painter.drawLine(points[-1], self._cursorPoint)
 
         # Return to normal composition mode
         painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_SourceOver)
 
-        for i, point in enumerate(points):
-            if i == self._hightlightedPointIndex:
-                painter.setPen(self._highlightedPointPen)
-            else:
-                painter.setPen(self._pointsPen)
-            painter.drawPoint(point)
+        # One draw call for all the points, plus one for the highlighted point
+        highlighted = self._hightlightedPointIndex
+        painter.setPen(self._pointsPen)
+        painter.drawPoints(QtGui.QPolygon([point for i, point in enumerate(points) if i != highlighted]))
+        if 0 <= highlighted < len(points):
+            painter.setPen(self._highlightedPointPen)
+            painter.drawPoint(points[highlighted])
+        painter.end()
 
-        if not self._hasFinished or self._draggedPointIndex != -1:
-            self._drawZoomRect(painter)
+        self._staticLayerPixmap, self._staticLayerKey = layer, key
+        return layer
 
     def _drawZoomRect(self, painter: QtGui.QPainter):
         """
@@ -156,22 +247,21 @@ class PixmapPointsDisplay(PixmapDisplay):
         # Draw zoom rect
         if self._cursorPoint is None:
             return
+        if self._sourceImage is None:
+            return
         cursorDest, cursorSource = self._cursorPoint, self._widgetToImage(self._cursorPoint)
-        pixmap = self.pixmap()
 
         srcW, srcH = self._zoomRectSourceSize, self._zoomRectSourceSize
         srcX, srcY = cursorSource.x() - srcW // 2, cursorSource.y() - srcH // 2
 
-        destX, destY = 0, 0
-        destW, destH = self._zoomRectDestSize, self._zoomRectDestSize
-        if cursorDest.x() < destW + 20 and cursorDest.y() < destH + 20:
-            destX = self.width() - destW
+        destX, destY, destW, destH = self._zoomDestRect(cursorDest).getRect()
 
         painter.setBrush(self._zoomBackgroundBrush)
         painter.setPen(QtCore.Qt.NoPen)
         painter.drawRect(destX, destY, destW, destH)
 
-        painter.drawPixmap(destX, destY, destW, destH, pixmap, srcX, srcY, srcW, srcH)
+        sourceRect = QtCore.QRect(srcX, srcY, srcW, srcH)
+        painter.drawImage(QtCore.QRect(destX, destY, destW, destH), self._sourceImage, sourceRect)
 
         # Draw a crosshair (4 lines, leaving the center pixel visible) with inverted colors
         cx, cy = destX + destW // 2, destY + destH // 2
@@ -186,6 +276,47 @@ class PixmapPointsDisplay(PixmapDisplay):
         painter.drawLine(cx, cy - s, cx, cy - pp)  # top
         painter.drawLine(cx, cy + pp, cx, cy + s)  # bottom
 
+    def _zoomDestRect(self, cursor: QtCore.QPoint) -> QtCore.QRect:
+        """
+        Gets the rect where the zoom rect is drawn for the given cursor position. The zoom rect
+        is drawn at the top left corner, or at the top right corner if the cursor is over it.
+        """
+        destW, destH = self._zoomRectDestSize, self._zoomRectDestSize
+        destX = 0
+        if cursor.x() < destW + 20 and cursor.y() < destH + 20:
+            destX = self.width() - destW
+        return QtCore.QRect(destX, 0, destW, destH)
+
+    def _cursorDirtyRect(self, cursor: QtCore.QPoint) -> QtCore.QRect:
+        """
+        Gets the area of the widget painted differently depending on the cursor position:
+        the zoom rect and the line from the last point to the cursor.
+        """
+        rect = QtCore.QRect()
+        if cursor is None:
+            return rect
+        if not self._hasFinished or self._draggedPointIndex != -1:
+            rect = rect.united(self._zoomDestRect(cursor))
+        points = self._pointsWidgetSpace
+        if not self._hasFinished and len(points) > 0:
+            rect = rect.united(QtCore.QRect(points[-1], cursor).normalized())
+        return self._withPenMargin(rect)
+
+    def _pointDirtyRect(self, index: int) -> QtCore.QRect:
+        """
+        Gets the area of the widget covered by the point with the given index.
+        """
+        if index < 0 or index >= len(self._pointsWidgetSpace):
+            return QtCore.QRect()
+        point = self._pointsWidgetSpace[index]
+        return self._withPenMargin(QtCore.QRect(point, point))
+
+    def _withPenMargin(self, rect: QtCore.QRect) -> QtCore.QRect:
+        if rect.isNull():
+            return rect
+        m = self._highlightedPointPen.width()  # The widest pen
+        return rect.adjusted(-m, -m, m, m)
+
     def _widgetToImage(self, point: QtCore.QPoint) -> QtCore.QPoint:
         """
         Converts a point from widget space to image space and clamps it to the image's bounds.
@@ -216,7 +347,7 @@ class PixmapPointsDisplay(PixmapDisplay):
                 # Remove the last point
                 if len(self._pointsImageSpace) > 0:
                     self._pointsImageSpace.pop()
-                    self._pointsWidgetSpace.pop()
+                    self._syncPoints()
                     self.pointsChanged.emit()
                     self.update()
 
@@ -224,24 +355,36 @@ class PixmapPointsDisplay(PixmapDisplay):
         """
         Handles mouse move events.
         """
+        oldCursor = self._cursorPoint
+        oldHighlightedPointIndex = self._hightlightedPointIndex
         self._cursorPoint = event.pos()
         cursorPosInImageSpace = self._widgetToImage(event.pos())
 
         if self._draggedPointIndex >= 0:
-            # Drag a point
+            # Drag a point. This changes the polygon, so the whole widget is repainted.
             self.setPoint(self._draggedPointIndex, cursorPosInImageSpace)
+            self._updateCursor()
+            return
         elif self._hasFinished:
-            # Check if the cursor is over a point
+            # Check if the cursor is over a point (the closest one by manhattan distance)
             self._hightlightedPointIndex = -1
-            minDist = self._pointHitAreaRadius
-            for i, point in enumerate(self._pointsWidgetSpace):
-                distance = (point - event.pos()).manhattanLength()
-                if distance < minDist:
+            if len(self._pointsWidgetSpaceArr) > 0:
+                pos = event.pos()
+                distances = np.abs(self._pointsWidgetSpaceArr - (pos.x(), pos.y())).sum(axis=1)
+                i = int(np.argmin(distances))
+                if distances[i] < self._pointHitAreaRadius:
                     self._hightlightedPointIndex = i
-                    minDist = distance
 
         self._updateCursor()
-        self.update()
+
+        # Only repaint the areas that depend on the cursor position.
+        dirty = self._cursorDirtyRect(oldCursor).united(self._cursorDirtyRect(self._cursorPoint))
+        if oldHighlightedPointIndex != self._hightlightedPointIndex:
+            self._invalidateStaticLayer()
+            dirty = dirty.united(self._pointDirtyRect(oldHighlightedPointIndex))
+            dirty = dirty.united(self._pointDirtyRect(self._hightlightedPointIndex))
+        if not dirty.isNull():
+            self.update(dirty)
 
     def _updateCursor(self):
         if self._draggedPointIndex >= 0:
@@ -267,6 +410,7 @@ class PixmapPointsDisplay(PixmapDisplay):
                 self.addPoint(point)
                 if len(self._pointsImageSpace) == self._requiredPoints:
                     self._hasFinished = True
+                    self._invalidateStaticLayer()
                     self.finished.emit()
             self._updateCursor()
             self.update()
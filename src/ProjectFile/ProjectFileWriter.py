@@ -171,12 +171,21 @@ class ProjectFileWriter(ProjectFileBase):
         data = self._encode_file(self._project)
         indent = 4 if not self.minify else None
 
-        if self.gzip:
-            with gzip.open(path, "wt") as f:
-                json.dump(data, f, indent=indent)
-        else:
-            with open(path, "w") as f:
-                json.dump(data, f, indent=indent)
+        # The project is written to a temporary file that then replaces the real one, so if
+        # the application crashes in the middle of a save the previous project file is intact.
+        tmp_path = path + ".tmp"
+        try:
+            if self.gzip:
+                with gzip.open(tmp_path, "wt") as f:
+                    json.dump(data, f, indent=indent)
+            else:
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f, indent=indent)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     def _file_is_aleady_in_folder(self, file_path: str, folder_path: str) -> bool:
         """
@@ -36,6 +36,14 @@ class ProjectManager:
 
     _warningImageCount = 2000
 
+    # Custom directory icons and symlink resolution make the dialogs stat every entry,
+    # which is very slow on network drives and folders with thousands of images.
+    _fileDialogOptions = QtWidgets.QFileDialog.Option.DontUseCustomDirectoryIcons
+
+    _folderDialogOptions = (_fileDialogOptions
+                            | QtWidgets.QFileDialog.Option.ShowDirsOnly
+                            | QtWidgets.QFileDialog.Option.DontResolveSymlinks)
+
     def __init__(self, workspace: Workspace) -> None:
         """
         Initializes a new instance of the ProjectManager class.
@@ -59,8 +67,8 @@ class ProjectManager:
 
         if folder_path is None:
             folder_path = QtWidgets.QFileDialog.getExistingDirectory(
-                parent, __("@project_manager.select_folder_caption"), ""
-            )
+                parent, __("@project_manager.select_folder_caption"), "",
+                self._folderDialogOptions)
             if not folder_path:
                 return
 
@@ -151,7 +159,7 @@ class ProjectManager:
 
         filePaths, _ = QtWidgets.QFileDialog.getOpenFileNames(
             parent, __("@project_manager.select_images_caption"), "",
-            self._importFilter)
+            self._importFilter, options=self._fileDialogOptions)
 
         if not filePaths:
             return
@@ -189,7 +197,8 @@ class ProjectManager:
         else:
             # If there are multiple images, export a folder.
             folder_path = QtWidgets.QFileDialog.getExistingDirectory(
-                parent, __("@project_manager.select_export_folder_caption"), "")
+                parent, __("@project_manager.select_export_folder_caption"), "",
+                self._folderDialogOptions)
 
             paths = [folder_path + "/" + image.display_name for image in images]
             self._exportImagesCore(parent, images, paths)
@@ -405,10 +414,17 @@ class ProjectManager:
         currentPath = self._workspace.project().path
         file_dir = os.path.dirname(currentPath) if currentPath else ""
 
-        file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
+        dialog = QtWidgets.QFileDialog(
             parent, __("@project_manager.select_project_save_caption"), file_dir,
             self._projectFilter)
+        dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptMode.AcceptSave)
+        # Some platform dialogs do not append the extension of the selected filter. The default
+        # suffix is added by the dialog itself, before it asks to overwrite an existing file.
+        dialog.setDefaultSuffix(self._projectExtension)
+        if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
+            return
 
+        file_path = dialog.selectedFiles()[0]
         if file_path:
             portable = self._askForPortableMode(parent)
             self._saveProjectCore(parent, file_path, portable=portable)
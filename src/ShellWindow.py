@@ -6,56 +6,55 @@ from .l10n import __
 from .Models import Image
 from .Workspace import BatchProgress
 from .Main.AboutWindow import AboutWindow
-from . import constants
+from . import constants, resources
 
 
 class MainMenuBar(QtWidgets.QMenuBar):
 
-    _customMenus: list[QtWidgets.QMenu] = []
-
-    _selectedImages: list[Image] = []
-
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        self._customMenus = []  # type: list[QtWidgets.QMenu]
+        self._selectedImages = []  # type: list[Image]
+
         self.newProjectAction = QtGui.QAction(
-            QtGui.QIcon("res/img/new_project.png"), __("New Project"), self)
+            resources.icon("res/img/new_project.png"), __("New Project"), self)
         self.newProjectAction.setShortcut("Ctrl+N")
         self.newProjectAction.triggered.connect(self._onNewProjectPressed)
 
         self.openProjectAction = QtGui.QAction(
-            QtGui.QIcon("res/img/folder.png"), __("Open Project..."), self)
+            resources.icon("res/img/folder.png"), __("Open Project..."), self)
         self.openProjectAction.setShortcut("Ctrl+O")
         self.openProjectAction.triggered.connect(self._onOpenProjectPressed)
 
         self.saveProjectAction = QtGui.QAction(
-            QtGui.QIcon("res/img/save.png"), __("Save Project"), self)
+            resources.icon("res/img/save.png"), __("Save Project"), self)
         self.saveProjectAction.setEnabled(False)
         self.saveProjectAction.setShortcut("Ctrl+S")
         self.saveProjectAction.triggered.connect(self._onSaveProjectPressed)
 
         self.saveProjectAsAction = QtGui.QAction(
-            QtGui.QIcon("res/img/save_as.png"), __("Save Project As..."), self)
+            resources.icon("res/img/save_as.png"), __("Save Project As..."), self)
         self.saveProjectAsAction.setShortcut("Ctrl+Shift+S")
         self.saveProjectAsAction.triggered.connect(self._onSaveProjectAsPressed)
 
         self.exitAction = QtGui.QAction(
-            QtGui.QIcon("res/img/exit.png"), __("Exit"), self)
+            resources.icon("res/img/exit.png"), __("Exit"), self)
         self.exitAction.setShortcut("Ctrl+Q")
         self.exitAction.triggered.connect(self._onExitPressed)
 
         self.addImagesAction = QtGui.QAction(
-            QtGui.QIcon("res/img/image_add.png"), __("Add Images..."), self)
+            resources.icon("res/img/image_add.png"), __("Add Images..."), self)
         self.addImagesAction.setToolTip(__("Add images to current project"))
         self.addImagesAction.triggered.connect(self._onAddImagesPressed)
 
         self.addFolderAction = QtGui.QAction(
-            QtGui.QIcon("res/img/folder_add.png"), __("Add From Folder..."), self)
+            resources.icon("res/img/folder_add.png"), __("Add From Folder..."), self)
         self.addFolderAction.setToolTip(__("Add images from folder to current project"))
         self.addFolderAction.triggered.connect(self._onAddFolderPressed)
 
         self.exportImageAction = QtGui.QAction(
-            QtGui.QIcon("res/img/image_save.png"), __("Export Image..."), self)
+            resources.icon("res/img/image_save.png"), __("Export Image..."), self)
         self.exportImageAction.setEnabled(False)
         self.exportImageAction.triggered.connect(self._onExportImagePressed)
 
@@ -71,21 +70,30 @@ class MainMenuBar(QtWidgets.QMenuBar):
         self._fileMenu.addSeparator()
         self._fileMenu.addAction(self.exitAction)
 
+        self.languageAction = QtGui.QAction(__("@menubar.settings.language"), self)
+        self.languageAction.triggered.connect(self._onLanguagePressed)
+
+        self.reportIssueAction = QtGui.QAction(__("@menubar.help.report_issue"), self)
+        self.reportIssueAction.triggered.connect(self._onReportIssuePressed)
+
+        self.documentationAction = QtGui.QAction(__("@menubar.help.documentation"), self)
+        self.documentationAction.triggered.connect(self._onDocumentationPressed)
+
+        self.githubAction = QtGui.QAction(resources.icon("res/img/github.png"), __("@menubar.help.github"), self)
+        self.githubAction.triggered.connect(self._onGithubPressed)
+
+        self.aboutAction = QtGui.QAction(__("@menubar.help.about"), self)
+        self.aboutAction.triggered.connect(self._onAboutPressed)
+
         self._settingsMenu = self.addMenu(__("@menubar.settings.header"))
-        self._settingsMenu.addAction(__("@menubar.settings.language"), self._onLanguagePressed)
+        self._settingsMenu.addAction(self.languageAction)
 
         self._helpMenu = self.addMenu(__("@menubar.help.header"))
-        self._helpMenu.addAction(__("@menubar.help.report_issue"), self._onReportIssuePressed)
-        self._helpMenu.addAction(__("@menubar.help.documentation"), self._onDocumentationPressed)
-        self._helpMenu.addAction(QtGui.QIcon("res/img/github.png"), __("@menubar.help.github"), self._onGithubPressed)
+        self._helpMenu.addAction(self.reportIssueAction)
+        self._helpMenu.addAction(self.documentationAction)
+        self._helpMenu.addAction(self.githubAction)
         self._helpMenu.addSeparator()
-        self._helpMenu.addAction(__("@menubar.help.about"), self._onAboutPressed)
-
-        Application.workspace().isDirtyChanged.connect(self._onIsDirtyChanged)
-
-    @QtCore.Slot(bool)
-    def _onIsDirtyChanged(self, isDirty: bool) -> None:
-        self.saveProjectAction.setEnabled(isDirty)
+        self._helpMenu.addAction(self.aboutAction)
 
     @QtCore.Slot()
     def _onOpenProjectPressed(self) -> None:
@@ -140,15 +148,23 @@ class MainMenuBar(QtWidgets.QMenuBar):
     def _onLanguagePressed(self) -> None:
         LanguageWindow(self, needsRestart=True).exec()
 
-    def clearCustomMenus(self) -> None:
+    def setCustomMenus(self, menus: list[QtWidgets.QMenu]) -> None:
+        """
+        Sets the custom menus shown before the settings menu. Only the menus that
+        differ from the currently shown ones are removed or inserted.
+        """
+        newMenus = set(menus)
         for menu in self._customMenus:
-            self.removeAction(menu.menuAction())
-        self._customMenus.clear()
+            if menu not in newMenus:
+                self.removeAction(menu.menuAction())
+
+        currentMenus = set(self._customMenus)
+        for menu in menus:
+            if menu not in currentMenus:
+                # Menus are added before the settings menu
+                self.insertMenu(self._settingsMenu.menuAction(), menu)
 
-    def addCustomMenu(self, menu: QtWidgets.QMenu) -> None:
-        # Menus are added before the settings menu
-        self.insertMenu(self._settingsMenu.menuAction(), menu)
-        self._customMenus.append(menu)
+        self._customMenus = list(menus)
 
     def selectedImages(self) -> list[Image]:
         return self._selectedImages
@@ -189,13 +205,14 @@ class ShellWindow(QtWidgets.QMainWindow):
     The main window of the application. It displays the toolbars and a tab widget.
     """
 
-    _currentPage: QtWidgets.QWidget = None
-
-    _mainPage: QtWidgets.QWidget = None
-
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        self._currentPage = None  # type: QtWidgets.QWidget
+        self._mainPage = None  # type: QtWidgets.QWidget
+        self._workspace = Application.workspace()
+        self._appName = Application.applicationName()
+        self._cachedTitle = None  # type: str
         self._initUI()
 
     def _initUI(self):
@@ -223,17 +240,24 @@ class ShellWindow(QtWidgets.QMainWindow):
 
         self._menuBar = MainMenuBar(self)
         self.setMenuBar(self._menuBar)
-        Application.workspace().batchProgressChanged.connect(self._onBatchProgressChanged)
-        Application.workspace().isDirtyChanged.connect(self._onIsDirtyChanged)
-        Application.workspace().projectChanged.connect(self._onProjectChanged)
+        self._workspace.batchProgressChanged.connect(self._onBatchProgressChanged)
+        self._workspace.isDirtyChanged.connect(self._onIsDirtyChanged)
+        self._workspace.projectChanged.connect(self._onProjectChanged)
+
+        # The main page pulls in every feature page (and their dependencies), so it is
+        # built after the empty shell has been painted once.
+        QtCore.QTimer.singleShot(0, self._installMainPage)
 
-        from .Main.ProjectExplorerPage import ProjectExplorerPage
+    @QtCore.Slot()
+    def _installMainPage(self) -> None:
+        from .Main.ProjectExplorerPage import ProjectExplorerPage  # Avoid circular imports
         self._mainPage = ProjectExplorerPage(self)
         self.openPage(self._mainPage)
         self._hideCloseButtonForTab(index=0)
 
     @QtCore.Slot(BatchProgress)
     def _onBatchProgressChanged(self, batch: BatchProgress) -> None:
+        # The workspace already coalesces the progress updates, so they are applied right away.
         self._progressBar.setValue(batch.progress * 100)
 
         if batch.total == 0:
@@ -248,6 +272,7 @@ class ShellWindow(QtWidgets.QMainWindow):
 
     @QtCore.Slot(bool)
     def _onIsDirtyChanged(self, isDirty: bool) -> None:
+        self._menuBar.saveProjectAction.setEnabled(isDirty)
         self._updateWindowTitle()
 
     @QtCore.Slot()
@@ -255,10 +280,12 @@ class ShellWindow(QtWidgets.QMainWindow):
         self._updateWindowTitle()
 
     def _updateWindowTitle(self) -> None:
-        project = Application.workspace().project()
-        dirtyDot = "*" if Application.workspace().isDirty() else ""
-        appName = Application.applicationName()
-        self.setWindowTitle(f"{project.name}{dirtyDot} - {appName}")
+        project = self._workspace.project()
+        dirtyDot = "*" if self._workspace.isDirty() else ""
+        title = f"{project.name}{dirtyDot} - {self._appName}"
+        if title != self._cachedTitle:
+            self._cachedTitle = title
+            self.setWindowTitle(title)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         if not Application.projectManager().closeProject(self):
@@ -282,10 +309,7 @@ class ShellWindow(QtWidgets.QMainWindow):
         if isinstance(widget, NavigationPage):
             widget.onPageVisible()
 
-        self._menuBar.clearCustomMenus()
-        if isinstance(widget, NavigationPage):
-            for menu in widget.customMenus():
-                self._menuBar.addCustomMenu(menu)
+        self._menuBar.setCustomMenus(widget.customMenus() if isinstance(widget, NavigationPage) else [])
 
     def openPage(self, page: QtWidgets.QWidget) -> None:
         """
@@ -343,7 +367,7 @@ class ShellWindow(QtWidgets.QMainWindow):
 
         count = len(selectedImages)
         if (count == 0):
-            totalInProject = len(Application.workspace().project().images)
+            totalInProject = len(self._workspace.project().images)
             self.statusBar().showMessage(__("{count} images in the collection", count=totalInProject))
         elif (count == 1):
             self.statusBar().showMessage(selectedImages[0].path)
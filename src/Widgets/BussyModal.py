@@ -1,4 +1,5 @@
-import threading
+import logging
+from concurrent.futures import Future
 from typing import Callable
 
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -76,15 +77,20 @@ class BussyModal(QtWidgets.QDialog):
         super().showEvent(event)
 
         if self._task is not None:
-            threading.Thread(target=self._runTaskAndSignal).start()
+            from ..Application import Application  # Avoid circular imports
+            future = Application.executor().submit(self._task)
+            future.add_done_callback(self._onTaskDone)
 
     def hideEvent(self, event: QtGui.QHideEvent) -> None:
         super().hideEvent(event)
 
         self._task = None
 
-    def _runTaskAndSignal(self) -> None:
-        self._task()
+    def _onTaskDone(self, future: Future) -> None:
+        # Called from the worker thread. The signal is queued to the main thread.
+        error = future.exception()
+        if error is not None:
+            logging.error("Background task failed", exc_info=error)
         self._taskDone.emit()
 
     def task(self) -> Callable[[], None]:
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from typing import Any
 
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -9,19 +10,61 @@ class SizePreset:
     """
     Represents a size preset for a grid.
     """
-    def __init__(self, name: str, gridSize: QtCore.QSize, iconSize: QtCore.QSize) -> None:
+    def __init__(self, nameKey: str, gridSize: QtCore.QSize, iconSize: QtCore.QSize) -> None:
         """
         Initializes a new instance of the SizePreset class.
 
         Args:
-            name (str): The name of the preset.
+            nameKey (str): The localization key of the name of the preset.
             gridSize (QSize): The size of the grid.
             iconSize (QSize): The size of the icons.
         """
-        self.name = name
+        self.nameKey = nameKey
         self.gridSize = gridSize
         self.iconSize = iconSize
 
+    @property
+    def name(self) -> str:
+        """
+        The localized name of the preset. It is translated when read, not when the module is imported.
+        """
+        return __(self.nameKey)
+
+
+def scaledPixmap(pixmap: QtGui.QPixmap, size: QtCore.QSize) -> QtGui.QPixmap:
+    """
+    Returns the pixmap scaled to fit the given size, keeping the aspect ratio. The result
+    is stored in the application-wide QPixmapCache, keyed by the pixmap's cacheKey(),
+    so the same source pixmap shown in several grids is only scaled once.
+    """
+    key = f"grid:{pixmap.cacheKey()}:{size.width()}x{size.height()}"
+    scaled = QtGui.QPixmapCache.find(key)
+    if scaled is None or scaled.isNull():
+        scaled = pixmap.scaled(size, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        QtGui.QPixmapCache.insert(key, scaled)
+    return scaled
+
+
+class GridItemDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Item delegate used by the GridBase class. All the items in a grid have the same size, so
+    the size hint is taken from the grid size instead of being stored in every item.
+    """
+
+    def __init__(self, grid: QtWidgets.QListView, parent: QtCore.QObject = None) -> None:
+        """
+        Initializes a new instance of the GridItemDelegate class.
+
+        Args:
+            grid (QListView): The grid that uses this delegate.
+            parent (QObject): The parent object.
+        """
+        super().__init__(parent)
+        self._grid = grid
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        return self._grid.gridSize()
+
 
 class GridBase(QtWidgets.QListWidget):
     """
@@ -35,14 +78,27 @@ class GridBase(QtWidgets.QListWidget):
         def __init__(self, pixmap: QtGui.QPixmap, text: str) -> None:
             self.pixmap = pixmap
             self.text = text
+            self.currentIconSize = QtCore.QSize()
+            self.currentIcon = None  # type: QtGui.QIcon
+
+        def icon(self, size: QtCore.QSize) -> QtGui.QIcon:
+            """
+            Returns an icon with the pixmap scaled to fit the given size. The icon for the
+            current size is kept, and the scaled pixmaps are stored in the global QPixmapCache,
+            so switching back to a previous size preset is usually just a cache lookup.
+            """
+            if self.currentIcon is None or self.currentIconSize != size:
+                self.currentIcon = QtGui.QIcon(scaledPixmap(self.pixmap, size))
+                self.currentIconSize = QtCore.QSize(size)
+            return self.currentIcon
 
-    smallPreset = SizePreset(__("@grid_presets.small"), QtCore.QSize(100, 100), QtCore.QSize(80, 80))
+    smallPreset = SizePreset("@grid_presets.small", QtCore.QSize(100, 100), QtCore.QSize(80, 80))
 
-    mediumPreset = SizePreset(__("@grid_presets.medium"), QtCore.QSize(150, 150), QtCore.QSize(120, 120))
+    mediumPreset = SizePreset("@grid_presets.medium", QtCore.QSize(150, 150), QtCore.QSize(120, 120))
 
-    largePreset = SizePreset(__("@grid_presets.large"), QtCore.QSize(200, 200), QtCore.QSize(160, 160))
+    largePreset = SizePreset("@grid_presets.large", QtCore.QSize(200, 200), QtCore.QSize(160, 160))
 
-    hugePreset = SizePreset(__("@grid_presets.huge"), QtCore.QSize(250, 250), QtCore.QSize(200, 200))
+    hugePreset = SizePreset("@grid_presets.huge", QtCore.QSize(250, 250), QtCore.QSize(200, 200))
 
     def __init__(self, parent: QtWidgets.QWidget = None) -> None:
         """
@@ -55,6 +111,7 @@ class GridBase(QtWidgets.QListWidget):
 
         self._itemsSources = []  # type: list[GridBase._ItemData]
         self._sizePreset = None  # type: SizePreset
+        self._bulkAddDepth = 0
 
         self.setContentsMargins(0, 0, 0, 0)
         self.setViewMode(QtWidgets.QListView.ViewMode.IconMode)
@@ -63,6 +120,7 @@ class GridBase(QtWidgets.QListWidget):
         self.setMovement(QtWidgets.QListView.Movement.Static)
         self.setDragDropMode(QtWidgets.QListView.DragDropMode.NoDragDrop)
         self.setSelectionMode(QtWidgets.QListView.SelectionMode.SingleSelection)
+        self.setItemDelegate(GridItemDelegate(self))
         self.setSizePreset(GridBase.mediumPreset)
 
     def addItemCore(self, pixmap: QtGui.QPixmap, text: str, data: Any = None) -> None:
@@ -74,11 +132,33 @@ class GridBase(QtWidgets.QListWidget):
             text (str): The text to display.
             data (Any): The data to associate with the item.
         """
+        itemData = GridBase._ItemData(pixmap, text)
         item = QtWidgets.QListWidgetItem()
-        self.setItemCore(item, pixmap, text, data)
+        self._setItemCore(item, itemData, data)
 
         self.addItem(item)
-        self._itemsSources.append(GridBase._ItemData(pixmap, text))
+        self._itemsSources.append(itemData)
+
+    def beginBulkAdd(self) -> None:
+        """
+        Suspends the repaints of the grid while many items are added. Every call
+        must be paired with a call to endBulkAdd(). Calls can be nested.
+        """
+        self._bulkAddDepth += 1
+        if self._bulkAddDepth == 1:
+            self.setUpdatesEnabled(False)
+
+    def endBulkAdd(self) -> None:
+        """
+        Resumes the repaints of the grid after a call to beginBulkAdd(). The items
+        are laid out and painted once, when the outermost bulk add ends.
+        """
+        if self._bulkAddDepth == 0:
+            return
+        self._bulkAddDepth -= 1
+        if self._bulkAddDepth == 0:
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
 
     def setItemCore(self, item: QtWidgets.QListWidgetItem, pixmap: QtGui.QPixmap, text: str, data: Any = None) -> None:
         """
@@ -90,10 +170,19 @@ class GridBase(QtWidgets.QListWidget):
             text (str): The text to display.
             data (Any): The data to associate with the item.
         """
+        itemData = GridBase._ItemData(pixmap, text)
+        row = self.row(item)
+        if 0 <= row < len(self._itemsSources):
+            self._itemsSources[row] = itemData
+        self._setItemCore(item, itemData, data)
+
+    def _setItemCore(self, item: QtWidgets.QListWidgetItem, itemData: "GridBase._ItemData", data: Any = None) -> None:
+        """
+        Updates the item with the given item source.
+        """
+        text = itemData.text
         item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter | QtCore.Qt.AlignmentFlag.AlignBottom)
-        item.setSizeHint(self.gridSize())
-        resizedPixmap = pixmap.scaled(self.iconSize(), QtCore.Qt.AspectRatioMode.KeepAspectRatio)
-        item.setIcon(QtGui.QIcon(resizedPixmap))
+        item.setIcon(itemData.icon(self.iconSize()))
         item.setText(text)
         item.setToolTip(text)
         item.setStatusTip(text)
@@ -120,13 +209,61 @@ class GridBase(QtWidgets.QListWidget):
         self._itemsSources.clear()
         super().clear()
 
-    def _resizeItems(self) -> None:
+    def takeItem(self, row: int) -> QtWidgets.QListWidgetItem:
+        """
+        Removes and returns the item at the given row.
+
+        Args:
+            row (int): The row of the item.
+
+        Returns:
+            QListWidgetItem: The removed item.
+        """
+        if 0 <= row < len(self._itemsSources):
+            self._itemsSources.pop(row)
+        return super().takeItem(row)
+
+    @contextmanager
+    def _bulkItemUpdate(self):
+        """
+        Context manager used while updating the decoration of many items at once. Repaints are
+        suspended, and the viewport is repainted once at the end. The model signals are left on,
+        so proxies, delegates and accessibility still see every change, and a single dataChanged
+        covering all the rows is emitted at the end.
         """
-        Resize the items to fit the current icon size.
+        model = self.model()
+        # This can run in the middle of a bulk add (for example, a size preset change), so the
+        # previous state is restored instead of always enabling the updates again.
+        updatesEnabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            count = model.rowCount()
+            if count > 0:
+                model.dataChanged.emit(model.index(0, 0), model.index(count - 1, 0), [QtCore.Qt.ItemDataRole.DecorationRole])
+            if updatesEnabled:
+                self.setUpdatesEnabled(True)
+                self.viewport().update()
+
+    def _applyPreset(self, gridSize: QtCore.QSize, iconSize: QtCore.QSize) -> None:
         """
-        for i, item in enumerate(self._itemsSources):
-            resizedPixmap = item.pixmap.scaled(self.iconSize(), QtCore.Qt.AspectRatioMode.KeepAspectRatio)
-            self.item(i).setIcon(QtGui.QIcon(resizedPixmap))
+        Sets the grid size and the icon size and updates the icons of all the items in a single pass.
+
+        Args:
+            gridSize (QSize): The grid size.
+            iconSize (QSize): The icon size.
+        """
+        super().setGridSize(gridSize)
+        super().setIconSize(iconSize)
+
+        # Write the icons straight through the model, so no QListWidgetItem wrapper is
+        # created on the Python side for every row.
+        model = self.model()
+        decorationRole = QtCore.Qt.ItemDataRole.DecorationRole
+        with self._bulkItemUpdate():
+            for row, source in enumerate(self._itemsSources):
+                model.setData(model.index(row, 0), source.icon(iconSize), decorationRole)
 
     def setIconSize(self, size: QtCore.QSize) -> None:
         """
@@ -135,8 +272,7 @@ class GridBase(QtWidgets.QListWidget):
         Args:
             size (QSize): The icon size.
         """
-        super().setIconSize(size)
-        self._resizeItems()
+        self._applyPreset(self.gridSize(), size)
 
     def setSizePreset(self, sizePreset: SizePreset) -> None:
         """
@@ -146,8 +282,7 @@ class GridBase(QtWidgets.QListWidget):
             sizePreset (SizePreset): The size preset.
         """
         self._sizePreset = sizePreset
-        self.setGridSize(sizePreset.gridSize)
-        self.setIconSize(sizePreset.iconSize)
+        self._applyPreset(sizePreset.gridSize, sizePreset.iconSize)
 
     @staticmethod
     def sizePresets() -> list[SizePreset]:
@@ -175,7 +310,6 @@ class GridBase(QtWidgets.QListWidget):
         Args:
             size (QSize): The grid size.
         """
+        # The item size hints are provided by the GridItemDelegate, so there is no need to
+        # update the items one by one. The base class schedules a single relayout.
         super().setGridSize(size)
-
-        for i in range(self.count()):
-            self.item(i).setSizeHint(size)
@@ -1,4 +1,5 @@
 import os
+from dataclasses import dataclass
 
 from PIL import Image as PILImage
 from PIL.ExifTags import TAGS
@@ -9,6 +10,24 @@ from ..Models import Face, Image, Project
 from ..Widgets.PropertiesTable import PropertiesTable
 
 
+@dataclass(frozen=True, slots=True)
+class ImageFileInfo:
+    """
+    The information that can only be read from the header of an image file. The rest of the
+    basic information is already known by the Image object.
+    """
+    formatDescription: str
+    """The description of the image format."""
+    mode: str
+    """The color channels of the image."""
+    isAnimated: bool
+    """Whether the image is animated."""
+    frames: int
+    """The number of frames in the image."""
+    exif: dict[str, str]
+    """The EXIF data of the image."""
+
+
 class InfoProvider:
     """
     Base class for objects that provide information about a selected object.
@@ -26,23 +45,68 @@ class ImageInfoProvider(InfoProvider):
     Provides information an image.
     """
 
-    def __init__(self, image: list[Image]):
+    def __init__(self, image: Image, fileInfo: ImageFileInfo = None, fileInfoFailed: bool = False):
+        """
+        Initializes the ImageInfoProvider class.
+
+        Args:
+            image (Image): The image.
+            fileInfo (ImageFileInfo): The information read from the image file. If None, only
+                the information that does not require reading the file is shown.
+            fileInfoFailed (bool): Whether the image file could not be read. In that case an error
+                is shown instead of the file information.
+        """
         self._image = image
+        self._fileInfo = fileInfo
+        self._fileInfoFailed = fileInfoFailed
+
+    @staticmethod
+    def readFileInfo(path: str) -> ImageFileInfo:
+        """
+        Reads the information of an image file. Only the file header is parsed, the pixel
+        data is never decoded. This method is thread safe, so it can be called from a worker.
+
+        Args:
+            path (str): The path of the image file.
+
+        Returns:
+            ImageFileInfo: The information of the image file.
+        """
+        with PILImage.open(path) as pilImage:
+            exif = {}
+            info = pilImage.getexif()
+            if info:
+                for tag, value in info.items():
+                    decoded = TAGS.get(tag, tag)
+                    exif[decoded] = value
+
+            return ImageFileInfo(
+                formatDescription=pilImage.format_description,
+                mode=pilImage.mode,
+                isAnimated=getattr(pilImage, "is_animated", False),
+                frames=getattr(pilImage, "n_frames", 1),
+                exif=exif,
+            )
+
+    def needsFileInfo(self) -> bool:
+        """
+        Gets whether the image file must still be read with readFileInfo() to show the
+        format and EXIF information. Virtual images (without a file) never need it.
+        """
+        return self._fileInfo is None and not self._fileInfoFailed and self._image.exists
 
     def populate(self, table: PropertiesTable):
         """
         Populate the properties table with information about the selected object.
         """
         image = self._image
-        pilImage = PILImage.open(image.path)
-        self._printBasicInformation(table, image, pilImage)
+        self._printBasicInformation(table, image, self._fileInfo)
         self._printHashes(table, image)
-        self._printExif(table, pilImage)
+        self._printExif(table, self._fileInfo)
         self._printFaceDetection(table, image)
 
-    def _printBasicInformation(self, table: PropertiesTable, image: Image, pilImage: PILImage):
+    def _printBasicInformation(self, table: PropertiesTable, image: Image, fileInfo: ImageFileInfo):
         table.addHeader(__("Basic Information"))
-        fileSize = os.path.getsize(image.path)
         path = image.path
         original_path = image.original_path
 
@@ -52,28 +116,22 @@ class ImageInfoProvider(InfoProvider):
             table.addRow(__("Original Filename"), os.path.basename(original_path))
             table.addRow(__("Original Folder"), os.path.dirname(original_path))
 
-        table.addRow(__("Image Width"), pilImage.width)
-        table.addRow(__("Image Height"), pilImage.height)
-        table.addRow(__("File Size"), self._humanizeBytes(fileSize))
-        table.addRow(__("Image Format"), pilImage.format_description)
-        table.addRow(__("Color Channels"), pilImage.mode)
-        table.addRow(__("Animated"), self._bool(getattr(pilImage, "is_animated", False)))
-        frames = getattr(pilImage, "n_frames", 1)
-        if frames > 1:
-            table.addRow(__("Number of Frames"), frames)
+        table.addRow(__("Image Width"), image.width)
+        table.addRow(__("Image Height"), image.height)
+        if image.exists:
+            try:
+                table.addRow(__("File Size"), self._humanizeBytes(os.path.getsize(path)))
+            except OSError:  # The file was moved or deleted after the image was loaded
+                pass
 
-    def _getExif(self, image: PILImage) -> dict[str, str]:
-        """
-        Gets the EXIF data from the image.
-        """
-        exif = {}
-        info = image.getexif()
-        if info:
-            for tag, value in info.items():
-                decoded = TAGS.get(tag, tag)
-                exif[decoded] = value
+        if fileInfo is None:
+            return
 
-        return exif
+        table.addRow(__("Image Format"), fileInfo.formatDescription)
+        table.addRow(__("Color Channels"), fileInfo.mode)
+        table.addRow(__("Animated"), self._bool(fileInfo.isAnimated))
+        if fileInfo.frames > 1:
+            table.addRow(__("Number of Frames"), fileInfo.frames)
 
     def _bool(self, value: bool) -> str:
         """
@@ -100,9 +158,17 @@ class ImageInfoProvider(InfoProvider):
             for hash_type, hash in hashes.items():
                 table.addRow(hash_type.upper(), hash)
 
-    def _printExif(self, table: PropertiesTable, pilImage: PILImage):
+    def _printExif(self, table: PropertiesTable, fileInfo: ImageFileInfo):
         table.addHeader(__("EXIF Data"))
-        exif = self._getExif(pilImage)
+        if fileInfo is None:
+            if self._fileInfoFailed:
+                table.addInfo(__("Could not read the file information."))
+            elif self.needsFileInfo():
+                table.addInfo(__("Reading file information..."))
+            else:
+                table.addInfo(__("No EXIF data available."))
+            return
+        exif = fileInfo.exif
         if (len(exif) == 0):
             table.addInfo(__("No EXIF data available."))
         else:
@@ -1,12 +1,17 @@
+import logging
+import weakref
+from concurrent.futures import Future
 from typing import Any
 from PySide6 import QtCore, QtWidgets, QtGui
-from .InfoProviders import ImageInfoProvider, MultiImageInfoProvider, ProjectInfoProvider
+from .InfoProviders import ImageFileInfo, ImageInfoProvider, InfoProvider, MultiImageInfoProvider, ProjectInfoProvider
 
 from .PropertiesTable import PropertiesTable
 
+from .. import resources
 from ..Application import Application
 from ..l10n import __
 from ..Models import Face, Image
+from .LoadingIcon import LoadingIcon
 from .PixmapDisplay import PixmapDisplay
 
 
@@ -17,6 +22,12 @@ class _InspectorPixmapDisplay(PixmapDisplay):
 
     _faces: list[Face] = []
 
+    _faceImageRects: list[QtCore.QRectF] = []  # In image space
+
+    _faceRects: list[QtCore.QRectF] = []  # In widget space
+
+    _faceRectsTransform: QtGui.QTransform = None
+
     _defaultFacePen: QtGui.QPen = QtGui.QPen(QtCore.Qt.gray, 2)
 
     _selectedFacePen: QtGui.QPen = QtGui.QPen(QtCore.Qt.green, 2)
@@ -36,13 +47,21 @@ class _InspectorPixmapDisplay(PixmapDisplay):
         self._highlightedFacePen.setCosmetic(True)
 
     def setFaces(self, faces: list[Face]):
-        self._faces = faces
+        # The image face lists are mutated in place when an image is reprocessed, so keep a
+        # copy to be able to tell whether the faces actually changed.
+        if faces == self._faces:
+            return
+        self._faces = list(faces)
+        self._faceImageRects = [QtCore.QRectF(f.aabb.x, f.aabb.y, f.aabb.width, f.aabb.height) for f in self._faces]
+        self._faceRectsTransform = None  # The face rects are recomputed on the next paint
         self.update()
 
     def faces(self) -> list[Face]:
         return self._faces
 
     def setSelectedFace(self, face: Face):
+        if face is self._selectedFace:
+            return
         self._selectedFace = face
         self.update()
 
@@ -50,6 +69,8 @@ class _InspectorPixmapDisplay(PixmapDisplay):
         return self._selectedFace
 
     def setHighlightedFace(self, face: Face):
+        if face is self._highlightedFace:
+            return
         self._highlightedFace = face
         self.update()
 
@@ -57,33 +78,59 @@ class _InspectorPixmapDisplay(PixmapDisplay):
         return self._highlightedFace
 
     def setShowingFaces(self, showing: bool):
+        if showing == self._isShowingFaces:
+            return
         self._isShowingFaces = showing
         self.update()
 
     def isShowingFaces(self) -> bool:
         return self._isShowingFaces
 
+    def _updateFaceRects(self):
+        """
+        Maps the face rects to widget space. They only change when the faces or the image
+        placement change, so hovering or changing the selected face does not remap them.
+        """
+        transform = self._imageToWidgetTransform
+        if self._faceRectsTransform is not None and self._faceRectsTransform == transform:
+            return
+        self._faceRectsTransform = QtGui.QTransform(transform)
+        self._faceRects = [transform.mapRect(rect) for rect in self._faceImageRects]
+
     def paintEvent(self, event: QtCore.QEvent):
         super().paintEvent(event)
 
         if not self._isShowingFaces:
             return
 
+        self._updateFaceRects()
+        if len(self._faceRects) == 0:
+            return
+
         painter = QtGui.QPainter(self)
-        painter.setTransform(self._imageToWidgetTransform)  # Rects are in image coordinate space
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        for face in self._faces:
-            aabb = face.aabb
-            painter.setPen(self._getPenForFace(face))
-            painter.drawRect(QtCore.QRectF(aabb.x, aabb.y, aabb.width, aabb.height))
-
-    def _getPenForFace(self, face: Face) -> QtGui.QPen:
-        if face == self._selectedFace:
-            return self._selectedFacePen
-        elif face == self._highlightedFace:
-            return self._highlightedFacePen
-        else:
-            return self._defaultFacePen
+        if self._selectedFace is None and self._highlightedFace is None:
+            # Fast path: every face uses the default pen.
+            painter.setPen(self._defaultFacePen)
+            painter.drawRects(self._faceRects)
+            return
+
+        # Group the rects by pen, so there is one draw call per pen instead of one per face.
+        defaultRects, selectedRects, highlightedRects = [], [], []
+        for face, rect in zip(self._faces, self._faceRects):
+            if face == self._selectedFace:
+                selectedRects.append(rect)
+            elif face == self._highlightedFace:
+                highlightedRects.append(rect)
+            else:
+                defaultRects.append(rect)
+
+        for pen, rects in ((self._defaultFacePen, defaultRects),
+                           (self._highlightedFacePen, highlightedRects),
+                           (self._selectedFacePen, selectedRects)):
+            if len(rects) > 0:
+                painter.setPen(pen)
+                painter.drawRects(rects)
 
 
 class ImagePreview(QtWidgets.QWidget):
@@ -95,9 +142,14 @@ class ImagePreview(QtWidgets.QWidget):
 
     _facesRectsAreVisible: bool = True
 
+    # Used to send the pixmap image prepared in a worker thread back to the main thread.
+    _pixmapImageReady = QtCore.Signal(object, QtGui.QImage)  # (Image, QImage)
+
     def __init__(self):
         super().__init__()
 
+        self._pixmapImageReady.connect(self._onPixmapImageReady)
+
         layout = QtWidgets.QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
 
@@ -107,12 +159,12 @@ class ImagePreview(QtWidgets.QWidget):
         layout.addLayout(buttonsLayout)
 
         self._openButton = QtWidgets.QPushButton(__("Open"))
-        self._openButton.setIcon(QtGui.QIcon("res/img/photo_viewer.png"))
+        self._openButton.setIcon(resources.icon("res/img/photo_viewer.png"))
         self._openButton.clicked.connect(self._openButtonClicked)
         buttonsLayout.addWidget(self._openButton)
 
         self._toggleShowFacesButton = QtWidgets.QPushButton(__("Show Faces"))
-        self._toggleShowFacesButton.setIcon(QtGui.QIcon("res/img/face.png"))
+        self._toggleShowFacesButton.setIcon(resources.icon("res/img/face.png"))
         self._toggleShowFacesButton.clicked.connect(self._toggleShowFacesButtonClicked)
         buttonsLayout.addWidget(self._toggleShowFacesButton)
 
@@ -122,23 +174,31 @@ class ImagePreview(QtWidgets.QWidget):
         previewFrame = QtWidgets.QFrame()
         previewFrame.setFrameStyle(QtWidgets.QFrame.StyledPanel)
         previewFrame.setStyleSheet("background-color: #e0e0e0;")
-        previewFrameLayout = QtWidgets.QVBoxLayout()
+        self._loadingIcon = LoadingIcon()
+        self._loadingIcon.setVisible(False)
+        previewFrameLayout = QtWidgets.QGridLayout()
         previewFrameLayout.setContentsMargins(0, 0, 0, 0)
-        previewFrameLayout.addWidget(self._pixmapDisplay)
+        previewFrameLayout.addWidget(self._pixmapDisplay, 0, 0)
+        previewFrameLayout.addWidget(self._loadingIcon, 0, 0, QtCore.Qt.AlignmentFlag.AlignCenter)
         previewFrame.setLayout(previewFrameLayout)
         layout.addWidget(previewFrame)
 
         self.setLayout(layout)
 
     def setImage(self, image: Image):
+        # Re-inspecting the same image (for example, after it has been processed) keeps the
+        # pixmap that is already displayed, so the full resolution image is not uploaded again.
+        sameImage = image is not None and image is self._image
         self._image = image
         if image is not None:
             self._openButton.setEnabled(True)
-            self._pixmapDisplay.setPixmap(image.get_pixmap())
+            if not sameImage:
+                self._loadPixmap(image)
             self._pixmapDisplay.setFaces(image.faces)
             self._toggleShowFacesButton.setEnabled(len(image.faces) > 0)
         else:
             self._openButton.setEnabled(False)
+            self._loadingIcon.setVisible(False)
             self._pixmapDisplay.setPixmap(None)
             self._pixmapDisplay.setFaces([])
             self._toggleShowFacesButton.setEnabled(False)
@@ -147,6 +207,44 @@ class ImagePreview(QtWidgets.QWidget):
     def image(self) -> Image:
         return self._image
 
+    def _loadPixmap(self, image: Image):
+        """
+        Shows the pixmap of the given image. If the pixmap is not cached yet, the image is
+        loaded and converted in a worker thread and a loading icon is shown in the meantime.
+        """
+        pixmap = image.find_pixmap()
+        if pixmap is not None:
+            self._loadingIcon.setVisible(False)
+            self._pixmapDisplay.setPixmap(pixmap)
+            return
+
+        self._pixmapDisplay.setPixmap(None)
+        self._loadingIcon.setVisible(True)
+        future = Application.executor().submit(image.prepare_pixmap_image)
+        future.add_done_callback(lambda f: self._onPixmapImageDone(image, f))
+
+    def _onPixmapImageDone(self, image: Image, future: Future):
+        """
+        Called from the worker thread when the pixmap image of an image has been prepared.
+        """
+        e = future.exception()
+        if e is not None:
+            logging.warning(f"Error loading the image {image.display_name}: {e}")
+            self._pixmapImageReady.emit(image, QtGui.QImage())  # A null image hides the loading icon
+            return
+        self._pixmapImageReady.emit(image, future.result())
+
+    @QtCore.Slot(object, QtGui.QImage)
+    def _onPixmapImageReady(self, image: Image, qimage: QtGui.QImage):
+        if image is not self._image:  # Another image was selected in the meantime.
+            return
+        self._loadingIcon.setVisible(False)
+        if qimage.isNull():  # The image could not be loaded
+            self._pixmapDisplay.setPixmap(None)
+            return
+        # QPixmaps can only be created in the main thread.
+        self._pixmapDisplay.setPixmap(image.get_pixmap(qimage))
+
     def _refreshFacesButton(self):
         facesCount = len(self._image.faces) if self._image is not None else 0
         facesButtonText = ""
@@ -191,12 +289,24 @@ class InspectorPanelBase(QtWidgets.QWidget):
     An abstract widget that serves as a base for the inspector panels.
     """
 
+    # Used to send the file information read in a worker thread back to the main thread.
+    _fileInfoReady = QtCore.Signal(int, object, object)  # (generation, Image, ImageFileInfo)
+
     def __init__(self):
         """
         Initializes the InspectorPanel class.
         """
         super().__init__()
 
+        # Incremented every time the inspected object changes, so the file information
+        # of an image that is no longer inspected is discarded when it arrives.
+        self._inspectGeneration = 0
+        self._inspectedImage = None  # type: Image
+        # The file information already read for each image, so re-inspecting an image
+        # (for example, after it has been processed) does not read the file again.
+        self._fileInfoCache = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[Image, ImageFileInfo]
+        self._fileInfoReady.connect(self._onFileInfoReady)
+
         splitter = QtWidgets.QSplitter()
         splitter.setContentsMargins(0, 0, 0, 0)
         splitter.setOrientation(QtCore.Qt.Vertical)
@@ -220,24 +330,36 @@ class InspectorPanelBase(QtWidgets.QWidget):
         """
         Inspects the current project.
         """
-        self._table.clear()
-        ProjectInfoProvider().populate(self._table)
+        self._inspectGeneration += 1
+        self._inspectedImage = None
+        self._populateTable(ProjectInfoProvider())
         self._preview.setImage(None)
 
     def inspectImage(self, image: Image):
         """
-        Inspects the given image.
+        Inspects the given image. The information that requires reading the image file
+        is read in a background thread and shown as soon as it is ready.
         """
-        self._table.clear()
-        ImageInfoProvider(image).populate(self._table)
+        sameImage = image is self._inspectedImage
+        self._inspectGeneration += 1
+        self._inspectedImage = image
+        provider = ImageInfoProvider(image, self._fileInfoCache.get(image))
         self._preview.setImage(image)
+        self._populateTable(provider, keepSelection=sameImage)
+        if not provider.needsFileInfo():
+            return
+
+        generation = self._inspectGeneration
+        future = Application.executor().submit(ImageInfoProvider.readFileInfo, image.path)
+        future.add_done_callback(lambda f: self._onFileInfoDone(generation, image, f))
 
     def inspectImages(self, images: list[Image]):
         """
         Inspects the given images.
         """
-        self._table.clear()
-        MultiImageInfoProvider(images).populate(self._table)
+        self._inspectGeneration += 1
+        self._inspectedImage = None
+        self._populateTable(MultiImageInfoProvider(images))
         self._preview.setImage(None)
 
     def inspectFaces(self, faces: list[Face]):
@@ -254,7 +376,40 @@ class InspectorPanelBase(QtWidgets.QWidget):
         self.inspectImage(face.image)
         self._preview.setHighlightedFace(face)
 
-    @QtCore.Slot()
+    def _populateTable(self, provider: InfoProvider, keepSelection: bool = False) -> None:
+        """
+        Replaces the contents of the properties table with the information of the given provider.
+
+        Args:
+            provider (InfoProvider): The provider that populates the table.
+            keepSelection (bool): Whether to select again the rows that were selected before.
+        """
+        selectionKeys = self._table.selectionKeys() if keepSelection else []
+        with self._table.batch():
+            self._table.clear()
+            provider.populate(self._table)
+        self._table.restoreSelection(selectionKeys)
+
+    def _onFileInfoDone(self, generation: int, image: Image, future: Future) -> None:
+        """
+        Called from the worker thread when the file information of an image has been read.
+        """
+        e = future.exception()
+        if e is not None:
+            logging.warning(f"Error reading the file information of {image.display_name}: {e}")
+            self._fileInfoReady.emit(generation, image, None)  # Shows the basic information and an error
+            return
+        self._fileInfoReady.emit(generation, image, future.result())
+
+    @QtCore.Slot(int, object, object)
+    def _onFileInfoReady(self, generation: int, image: Image, fileInfo: ImageFileInfo) -> None:
+        if fileInfo is not None:
+            self._fileInfoCache[image] = fileInfo
+        if generation != self._inspectGeneration:  # Another object was inspected in the meantime.
+            return
+        self._populateTable(ImageInfoProvider(image, fileInfo, fileInfoFailed=fileInfo is None), keepSelection=True)
+
+    @QtCore.Slot(object)
     def _onTableSelectionChanged(self, value: Any):
         """
         Called when the user selects a value in the table.
@@ -1,10 +1,67 @@
+import weakref
+
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from .. import resources
+
+
+class _LoadingIconClock(QtCore.QObject):
+    """
+    Drives the animation of all the loading icons that spin at the same speed,
+    so many icons on screen share a single timer instead of having one each.
+    """
+
+    def __init__(self, interval: int) -> None:
+        """
+        Initializes a new instance of the _LoadingIconClock class.
+
+        Args:
+            interval (int): The interval between frames in milliseconds.
+        """
+        super().__init__()
+        self.angle: float = 0  # degrees
+        self._icons = weakref.WeakSet()  # type: weakref.WeakSet[LoadingIcon]
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._onTimeout)
+
+    def addIcon(self, icon: "LoadingIcon") -> None:
+        """Starts animating the given icon."""
+        self._icons.add(icon)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def removeIcon(self, icon: "LoadingIcon") -> None:
+        """Stops animating the given icon."""
+        self._icons.discard(icon)
+        if len(self._icons) == 0:
+            self._timer.stop()
+
+    @QtCore.Slot()
+    def _onTimeout(self) -> None:
+        if len(self._icons) == 0:  # All the icons were destroyed
+            self._timer.stop()
+            return
+        self.angle = (self.angle + 45) % 360
+        for icon in list(self._icons):
+            try:
+                icon.update()
+            except RuntimeError:  # The underlying widget was already deleted
+                self._icons.discard(icon)
+
 
 class LoadingIcon(QtWidgets.QWidget):
     """
     A simple loading icon that can be used to indicate that the application is busy.
     """
+
+    _clocks = {}  # type: dict[int, _LoadingIconClock]
+    """The shared clocks, by timer interval."""
+
+    _framesCache = {}  # type: dict[tuple[int, int, float], list[QtGui.QPixmap]]
+    """The pre-rendered animation frames, by icon size and device pixel ratio."""
+
     def __init__(self, parent: QtWidgets.QWidget = None) -> None:
         """
         Initializes a new instance of the LoadingIcon class.
@@ -15,17 +72,15 @@ class LoadingIcon(QtWidgets.QWidget):
         super().__init__(parent)
 
         self._speed: float = 1.0  # rotations per second
-        self._angle: float = 0  # degrees
-
-        self._timer = QtCore.QTimer(self)
-        self._timer.timeout.connect(self._onTimeout)
-        self._timer.start(self._getTimerInterval())
-
-        self._image = QtGui.QImage("res/img/spinner.png")
+        # The icon only registers with the clock while it is visible, so hidden icons do not
+        # keep the timer running.
+        self._clock = self._getClock(self._getTimerInterval())
 
         self.setFixedSize(32, 32)
         self.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
 
+        self._frames = self._getFrames(self.size(), self.devicePixelRatioF())
+
     def speed(self) -> float:
         """Gets the speed of the animation measured in rotations per second."""
         return self._speed
@@ -33,25 +88,74 @@ class LoadingIcon(QtWidgets.QWidget):
     def setSpeed(self, value: float) -> None:
         """Sets the speed of the animation measured in rotations per second."""
         self._speed = value
-        self._timer.setInterval(self._getTimerInterval())
+        self._clock.removeIcon(self)
+        self._clock = self._getClock(self._getTimerInterval())
+        if self.isVisible():
+            self._clock.addIcon(self)
 
     def _getTimerInterval(self) -> int:
         return int(1000 / self._speed / 8)
 
-    def _onTimeout(self) -> None:
-        self._angle = (self._angle + 45) % 360
-        self.update()
+    @classmethod
+    def _getClock(cls, interval: int) -> _LoadingIconClock:
+        """
+        Gets the clock shared by all the icons that animate with the given interval.
+        """
+        clock = cls._clocks.get(interval)
+        if clock is None:
+            clock = cls._clocks[interval] = _LoadingIconClock(interval)
+        return clock
+
+    @classmethod
+    def _getFrames(cls, size: QtCore.QSize, dpr: float) -> list[QtGui.QPixmap]:
+        """
+        Gets the animation frames for the given size and device pixel ratio. The frames are shared by all the icons.
+        """
+        key = (size.width(), size.height(), dpr)
+        frames = cls._framesCache.get(key)
+        if frames is None:
+            frames = cls._framesCache[key] = cls._renderFrames(resources.image("res/img/spinner.png"), size, dpr)
+        return frames
+
+    @staticmethod
+    def _renderFrames(image: QtGui.QImage, size: QtCore.QSize, dpr: float) -> list[QtGui.QPixmap]:
+        """
+        Pre-renders the 8 rotation steps of the animation, so painting a frame is a plain blit.
+        The frames are rendered at device resolution, so they stay sharp on HiDPI screens.
+        """
+        w, h = size.width(), size.height()
+        frames = []
+        for i in range(8):
+            frame = QtGui.QPixmap(round(w * dpr), round(h * dpr))
+            frame.setDevicePixelRatio(dpr)
+            frame.fill(QtCore.Qt.GlobalColor.transparent)
+            painter = QtGui.QPainter(frame)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform)
+            painter.translate(w / 2, h / 2)
+            painter.rotate(i * 45)
+            painter.drawImage(QtCore.QRectF(-w / 2, -h / 2, w, h), image)
+            painter.end()
+            frames.append(frame)
+        return frames
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        # The screen (and so the device pixel ratio) is only known once the widget is shown.
+        self._frames = self._getFrames(self.size(), self.devicePixelRatioF())
+        self._clock.addIcon(self)
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        super().hideEvent(event)
+        self._clock.removeIcon(self)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        super().closeEvent(event)
+        self._clock.removeIcon(self)
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        painter.translate(self.width() / 2, self.height() / 2)
-        painter.rotate(self._angle)
-
-        # draw scaled image
-        painter.drawImage(
-            QtCore.QRect(-self.width() / 2, -self.height() / 2, self.width(), self.height()),
-            self._image)
+        frame = self._frames[int(self._clock.angle // 45) % 8]
+        QtGui.QPainter(self).drawPixmap(0, 0, frame)
 
     def sizeHint(self) -> QtCore.QSize:
         return QtCore.QSize(32, 32)
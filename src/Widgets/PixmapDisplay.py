@@ -22,6 +22,10 @@ class PixmapDisplay(QtWidgets.QWidget):
 
     _isDirty = True
 
+    _scaleCacheKey: tuple = None
+
+    _isResizing = False
+
     """
     Widget for displaying a QPixmap. The image is scaled proportionally to fit the widget.
     This class can also be used as a base class for editors that display an image.
@@ -36,6 +40,13 @@ class PixmapDisplay(QtWidgets.QWidget):
         super().__init__(parent)
         self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
 
+        # While the widget is being resized the image is scaled with the fast transformation.
+        # The smooth one is used again once the size stops changing.
+        self._resizeEndTimer = QtCore.QTimer(self)
+        self._resizeEndTimer.setSingleShot(True)
+        self._resizeEndTimer.setInterval(150)
+        self._resizeEndTimer.timeout.connect(self._onResizeEnd)
+
         pixmap is not None and self.setPixmap(pixmap)
 
     def setPixmap(self, pixmap: QtGui.QPixmap) -> None:
@@ -84,7 +95,8 @@ class PixmapDisplay(QtWidgets.QWidget):
         return self._aspectRatioMode
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
-        self._processDirty()
+        if self._isDirty:  # Checked inline, most repaints are for overlays drawn by derived classes
+            self._processDirty()
 
         super().paintEvent(event)
 
@@ -108,7 +120,7 @@ class PixmapDisplay(QtWidgets.QWidget):
         if self._pixmap is not None:
             widgetW, widgetH = self.width(), self.height()
             imageW, imageH = self._pixmap.width(), self._pixmap.height()
-            self._resizedPixmap = self._pixmap.scaled(widgetW, widgetH, self._aspectRatioMode, self._transformationMode)
+            self._resizedPixmap = self._scaledPixmap(widgetW, widgetH)
 
             w, h = self._resizedPixmap.width(), self._resizedPixmap.height()
             x, y = (widgetW - w) / 2, (widgetH - h) / 2
@@ -131,27 +143,63 @@ class PixmapDisplay(QtWidgets.QWidget):
         if oldRect != self._imageRect:
             self.imageRectChangedEvent(self._imageRect)
 
+    def _scaledPixmap(self, widgetW: int, widgetH: int) -> QtGui.QPixmap:
+        """
+        Gets the pixmap scaled to the given widget size. The last scaled pixmap is reused when
+        nothing that affects the scaling has changed, and scaled pixmaps are shared through the
+        QPixmapCache between all the displays that show the same pixmap at the same size.
+        """
+        pixmap = self._pixmap
+        mode = self._transformationMode
+        if self._isResizing:
+            mode = QtCore.Qt.TransformationMode.FastTransformation
+        key = (pixmap.cacheKey(), widgetW, widgetH, self._aspectRatioMode, mode)
+        if key == self._scaleCacheKey and self._resizedPixmap is not None:
+            return self._resizedPixmap
+
+        cacheKey = f"display:{key[0]}:{widgetW}x{widgetH}:{key[3]}:{key[4]}"
+        resized = QtGui.QPixmapCache.find(cacheKey)
+        if resized is None or resized.isNull():
+            resized = pixmap.scaled(widgetW, widgetH, self._aspectRatioMode, mode)
+            if not self._isResizing:  # The intermediate sizes are not worth caching
+                QtGui.QPixmapCache.insert(cacheKey, resized)
+        self._scaleCacheKey = key
+        return resized
+
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
         self._isDirty = True
+        smooth = self._transformationMode == QtCore.Qt.TransformationMode.SmoothTransformation
+        if smooth and self._pixmap is not None and self.isVisible() and event.oldSize().isValid():
+            self._isResizing = True
+            self._resizeEndTimer.start()
+
+    @QtCore.Slot()
+    def _onResizeEnd(self) -> None:
+        self._isResizing = False
+        self._isDirty = True
+        self.update()
 
     def widgetToImageTransform(self) -> QtGui.QTransform:
         """
         Gets the transform that converts points from the widget's coordinate system to the image's coordinate system.
         """
-        self._processDirty()
+        if self._isDirty:
+            self._processDirty()
         return self._widgetToImageTransform
 
     def imageToWidgetTransform(self) -> QtGui.QTransform:
         """
         Gets the transform that converts points from the image's coordinate system to the widget's coordinate system.
         """
-        self._processDirty()
+        if self._isDirty:
+            self._processDirty()
         return self._imageToWidgetTransform
 
     def imageRect(self) -> QtCore.QRect:
         """
         Gets the rectangle that the image is drawn into.
         """
-        self._processDirty()
+        if self._isDirty:
+            self._processDirty()
         return self._imageRect
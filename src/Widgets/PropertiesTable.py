@@ -1,100 +1,192 @@
-from typing import Any
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterator
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from ..l10n import __
 
 
-class _Header(QtWidgets.QWidget):
-    """
-    A header for the PropertiesTable. The header shows in bold text and has a blue line decoration that extends to the right.
-    """
-    def __init__(self, text: str):
-        """
-        Initializes the Header class.
-        """
-        super().__init__()
-
-        self._layout = QtWidgets.QHBoxLayout()
-        self._layout.setContentsMargins(10, 0, 10, 0)
-        self.setLayout(self._layout)
+@lru_cache(maxsize=1024, typed=True)
+def _formatValueCached(value: Any) -> str:
+    return str(value) if value is not None else "—"  # em dash
 
-        self._label = QtWidgets.QLabel(text)
-        self._label.setStyleSheet("font-weight: bold; color: #0b3e66; margin-right: 5px;")
-        self._layout.addWidget(self._label)
 
-        self._line = QtWidgets.QFrame()
-        self._line.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        self._line.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        self._line.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
-        self._line.setStyleSheet("color: #0078d7;")
-        self._layout.addWidget(self._line)
-
-
-class _AbstractValueCell(QtWidgets.QTableWidgetItem):
+def _formatValue(value: Any) -> str:
+    """
+    Gets the text shown for a value. The texts of simple values are cached, since the same values
+    (for example None, booleans and small numbers) show up again every time the table is rebuilt.
+    Other values are not cached, so the cache does not keep them alive.
+    """
+    if value is None or type(value) in (bool, int, float, str):
+        return _formatValueCached(value)
+    return str(value)
+
+
+@dataclass(frozen=True, slots=True)
+class _Row:
+    """A row of the PropertiesTable."""
+    kind: int
+    """The kind of the row. One of the PropertiesTableModel.*Row constants."""
+    text: str
+    """The text of the first column (the key, the header or the info text)."""
+    valueText: str = None
+    """The text of the value column."""
+    value: Any = None
+    """The original value of the row."""
+    pixmap: QtGui.QPixmap = None
+    """The pixmap shown in the value column."""
+
+
+class PropertiesTableModel(QtCore.QAbstractTableModel):
     """
-    A cell that shows a value.
+    A model with "Property" and "Value" columns used by the PropertiesTable.
     """
 
-    def __init__(self, value: Any = None):
+    HeaderRow = 0
+    InfoRow = 1
+    TextRow = 2
+    PixmapRow = 3
+
+    KindRole = QtCore.Qt.ItemDataRole.UserRole + 1
+    """The role used to get the kind of a row."""
+
+    def __init__(self, parent: QtCore.QObject = None) -> None:
         """
-        Initializes the ValueCell class.
+        Initializes a new instance of the PropertiesTableModel class.
 
         Args:
-            value: The value to show.
+            parent (QObject): The parent object.
+        """
+        super().__init__(parent)
+        self._rows = []  # type: list[_Row]
+        self._headers = [__("Property"), __("Value")]
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+        if index.isValid() and self._rows[index.row()].kind == PropertiesTableModel.HeaderRow:
+            return QtCore.Qt.ItemFlag.ItemIsEnabled
+        return super().flags(index)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        Role = QtCore.Qt.ItemDataRole
+        if role == PropertiesTableModel.KindRole:
+            return row.kind
+        elif role == Role.UserRole:
+            return row.value
+
+        if index.column() == 0:
+            if role == Role.DisplayRole:
+                return row.text
+        elif role == Role.DisplayRole or role == Role.ToolTipRole:
+            return row.valueText
+        elif role == Role.DecorationRole:
+            return row.pixmap
+        return None
+
+    def row(self, row: int) -> _Row:
         """
-        super().__init__()
-        self._originalValue = value
+        Gets the row at the given index.
+        """
+        return self._rows[row]
 
-    def originalValue(self) -> str:
+    def rows(self) -> list[_Row]:
         """
-        Gets the original value.
+        Gets all the rows of the model.
         """
-        return self._originalValue
+        return self._rows
 
+    def appendRow(self, row: _Row) -> int:
+        """
+        Appends a row to the model and returns its index.
+        """
+        count = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), count, count)
+        self._rows.append(row)
+        self.endInsertRows()
+        return count
 
-class _TextValueCell(_AbstractValueCell):
-    """
-    A cell that shows a value.
-    """
-    def __init__(self, value: object = None):
+    def setRows(self, rows: list[_Row]) -> None:
         """
-        Initializes the ValueCell class.
+        Replaces all the rows of the model in a single reset.
         """
-        super().__init__(value)
-        value = str(value) if value is not None else "—"  # em dash
-        self.setText(value)
-        self.setToolTip(value)
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
 
 
-class _KeyCell(QtWidgets.QTableWidgetItem):
+class _PropertiesTableDelegate(QtWidgets.QStyledItemDelegate):
     """
-    A cell that shows a key.
+    Draws the header rows of the PropertiesTable. The header shows in bold text and has a
+    blue line decoration that extends to the right.
     """
-    pass
 
+    _headerColor = QtGui.QColor("#0b3e66")
 
-class _InfoCell(QtWidgets.QTableWidgetItem):
-    """
-    A cell that shows an info text.
-    """
-    pass
+    _lineColor = QtGui.QColor("#0078d7")
 
+    _baseFont: QtGui.QFont = None
 
-class _PixmapValueCell(_AbstractValueCell):
-    """
-    A cell that shows a pixmap.
-    """
-    def __init__(self, pixmap: QtGui.QPixmap, value: object = None):
+    _boldFont: QtGui.QFont = None
+
+    def helpEvent(self, event: QtGui.QHelpEvent, view: QtWidgets.QAbstractItemView,
+                  option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> bool:
+        # The value tooltip is only useful when the value does not fit in its cell.
+        if event.type() == QtCore.QEvent.Type.ToolTip and index.column() == 1:
+            text = index.data(QtCore.Qt.ItemDataRole.ToolTipRole) or ""
+            if option.fontMetrics.horizontalAdvance(text) + 10 <= option.rect.width():
+                QtWidgets.QToolTip.hideText()
+                return True
+        return super().helpEvent(event, view, option, index)
+
+    def _headerFont(self, font: QtGui.QFont) -> QtGui.QFont:
         """
-        Initializes the PixmapValueCell class.
+        Gets the bold version of the given font. It is cached while the view font does not change.
         """
-        super().__init__(value)
-        self._pixmap = pixmap
-        self.setData(QtCore.Qt.ItemDataRole.DecorationRole, pixmap)
+        if self._boldFont is None or font != self._baseFont:
+            self._baseFont = QtGui.QFont(font)
+            self._boldFont = QtGui.QFont(font)
+            self._boldFont.setBold(True)
+        return self._boldFont
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
+        if index.data(PropertiesTableModel.KindRole) != PropertiesTableModel.HeaderRow:
+            super().paint(painter, option, index)
+            return
 
+        text = index.data(QtCore.Qt.ItemDataRole.DisplayRole)
+        rect = option.rect.adjusted(10, 0, -10, 0)
+        font = self._headerFont(option.font)
 
-class PropertiesTable(QtWidgets.QTableWidget):
+        painter.save()
+        painter.setFont(font)
+        painter.setPen(self._headerColor)
+        textRect = painter.boundingRect(rect, QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter, text)
+        painter.drawText(textRect, QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter, text)
+        lineX = textRect.right() + 5
+        if lineX < rect.right():
+            painter.setPen(self._lineColor)
+            y = rect.center().y()
+            painter.drawLine(lineX, y, rect.right(), y)
+        painter.restore()
+
+
+class PropertiesTable(QtWidgets.QTableView):
     """
     A widget that shows a table with "Property" and "Value" columns. It can display headers
     and perform basic formating. It also provides a context menu with a "Copy" action.
@@ -113,9 +205,15 @@ class PropertiesTable(QtWidgets.QTableWidget):
             parent (QWidget): The parent widget.
         """
         super().__init__(parent)
-        self.setColumnCount(2)
-        self.setHorizontalHeaderLabels([__("Property"), __("Value")])
-        self.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
+        self._model = PropertiesTableModel(self)
+        self._bulkAddDepth = 0
+        self._pendingRows = []  # type: list[_Row]
+
+        self.setModel(self._model)
+        self.setItemDelegate(_PropertiesTableDelegate(self))
+        # A fixed (but user resizable) key column, so adding rows never re-measures all the keys.
+        self.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Interactive)
+        self.horizontalHeader().resizeSection(0, 160)
         self.horizontalHeader().setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
         self.verticalHeader().setDefaultSectionSize(20)
         self.verticalHeader().setVisible(False)
@@ -130,7 +228,19 @@ class PropertiesTable(QtWidgets.QTableWidget):
         copyAction = self._menu.addAction(__("Copy"))
         copyAction.triggered.connect(self.copy)
 
-        self.itemSelectionChanged.connect(self._onSelectionChanged)
+        self.selectionModel().selectionChanged.connect(self._onSelectionChanged)
+
+    def setKeyColumnWidth(self, width: int) -> None:
+        """
+        Sets the width of the key column in pixels.
+        """
+        self.horizontalHeader().resizeSection(0, width)
+
+    def keyColumnWidth(self) -> int:
+        """
+        Gets the width of the key column in pixels.
+        """
+        return self.horizontalHeader().sectionSize(0)
 
     def contextMenuEvent(self, e: QtGui.QContextMenuEvent) -> None:
         """
@@ -139,41 +249,131 @@ class PropertiesTable(QtWidgets.QTableWidget):
         Args:
             e (QContextMenuEvent): The event.
         """
-        if len(self.selectedItems()) > 0:
+        if len(self.selectedIndexes()) > 0:
             self._menu.exec_(e.globalPos())
 
+    def _selectedRows(self) -> list[_Row]:
+        """
+        Gets the selected rows, in table order.
+        """
+        rows = sorted({index.row() for index in self.selectionModel().selectedIndexes()})
+        return [self._model.row(row) for row in rows]
+
+    def selectionKeys(self) -> list[tuple]:
+        """
+        Gets a key that identifies each of the selected rows. The keys can be passed to
+        restoreSelection() to select the same rows again after the table is repopulated.
+        """
+        return [(row.kind, row.text, row.value) for row in self._selectedRows()]
+
+    def restoreSelection(self, keys: list[tuple]) -> None:
+        """
+        Selects the rows identified by the given keys, as returned by selectionKeys().
+
+        Args:
+            keys (list[tuple]): The keys of the rows to select.
+        """
+        if len(keys) == 0:
+            return
+        selection = QtCore.QItemSelection()
+        for i, row in enumerate(self._model.rows()):
+            if (row.kind, row.text, row.value) in keys:
+                selection.select(self._model.index(i, 0), self._model.index(i, self._model.columnCount() - 1))
+        self.selectionModel().select(selection, QtCore.QItemSelectionModel.SelectionFlag.ClearAndSelect)
+
     @QtCore.Slot()
     def copy(self):
         """
         Copies the selected text to the clipboard.
         """
-        selected = self.selectedItems()
+        selected = self._selectedRows()
         if len(selected) == 0:
             return
-        if len(selected) == 2:  # 2 because we have 2 columns
-            # if only one item is selected, just care about the value, not the key
-            text = selected[1].text()
+        if len(selected) == 1 and selected[0].kind != PropertiesTableModel.InfoRow:
+            # if only one row is selected, just care about the value, not the key
+            text = selected[0].valueText or ""
         else:
-            # if multiple items are selected, copy the key and value of each item
+            # if multiple rows are selected, copy the key and value of each row
             # in a tab-separated format. Example:
             # Key1    Value1\n
             # Key2    Value2\n
             # ...
-            text = ""
-            for item in selected:
-                if item is None:
-                    continue
-                if isinstance(item, _KeyCell):
-                    text += item.text() + "\t"
-                elif isinstance(item, _TextValueCell):
-                    text += item.text() + "\n"
-                elif isinstance(item, _InfoCell):
-                    text += item.text() + "\n"
-                elif isinstance(item, _PixmapValueCell):
-                    text += "\n"
-            text = text[:-1]  # remove the last newline
+            lines = []
+            for row in selected:
+                if row.kind == PropertiesTableModel.TextRow:
+                    lines.append(row.text + "\t" + row.valueText)
+                elif row.kind == PropertiesTableModel.InfoRow:
+                    lines.append(row.text)
+                elif row.kind == PropertiesTableModel.PixmapRow:
+                    lines.append(row.text + "\t")
+            text = "\n".join(lines)
         QtWidgets.QApplication.clipboard().setText(text)
 
+    def beginBulkAdd(self) -> None:
+        """
+        Starts adding many rows at once. The rows are buffered and inserted in the table in a
+        single model reset when endBulkAdd() is called. Calls can be nested.
+        """
+        if self._bulkAddDepth == 0:
+            self._pendingRows = list(self._model.rows())
+        self._bulkAddDepth += 1
+
+    def endBulkAdd(self) -> None:
+        """
+        Inserts all the rows added since the call to beginBulkAdd().
+        """
+        if self._bulkAddDepth == 0:
+            return
+        self._bulkAddDepth -= 1
+        if self._bulkAddDepth > 0:
+            return
+
+        rows, self._pendingRows = self._pendingRows, []
+        # The spans and row heights are applied with the updates disabled, so the table
+        # geometry is recomputed once for the whole batch instead of once per row.
+        self.setUpdatesEnabled(False)
+        try:
+            self.clearSpans()
+            self._model.setRows(rows)
+            for i, row in enumerate(rows):
+                self._setupRow(i, row)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._onSelectionChanged()
+
+    @contextmanager
+    def batch(self) -> Iterator["PropertiesTable"]:
+        """
+        Context manager that wraps beginBulkAdd() and endBulkAdd(). Example:
+
+            with table.batch():
+                table.clear()
+                table.addRow("Key", "Value")
+        """
+        self.beginBulkAdd()
+        try:
+            yield self
+        finally:
+            self.endBulkAdd()
+
+    def _addRowCore(self, row: _Row) -> None:
+        """
+        Adds a row to the table, or to the pending rows if a bulk add is in progress.
+        """
+        if self._bulkAddDepth > 0:
+            self._pendingRows.append(row)
+            return
+        self._setupRow(self._model.appendRow(row), row)
+
+    def _setupRow(self, index: int, row: _Row) -> None:
+        """
+        Sets the span and the height of a row that was added to the model.
+        """
+        if row.kind == PropertiesTableModel.HeaderRow or row.kind == PropertiesTableModel.InfoRow:
+            self.setSpan(index, 0, 1, 2)
+        elif row.kind == PropertiesTableModel.PixmapRow:
+            self.setRowHeight(index, row.pixmap.height())
+
     def addInfo(self, text: str):
         """
         Adds an info line to the table. The info line is a row with
@@ -182,10 +382,7 @@ class PropertiesTable(QtWidgets.QTableWidget):
         Args:
             text (str): The text to show in the info line.
         """
-        row = self.rowCount()
-        self.insertRow(row)
-        self.setSpan(row, 0, 1, 2)
-        self.setItem(row, 0, _InfoCell(text))
+        self._addRowCore(_Row(PropertiesTableModel.InfoRow, text))
 
     def addRow(self, key: str, value: str):
         """
@@ -195,10 +392,8 @@ class PropertiesTable(QtWidgets.QTableWidget):
             key (str): The key to show in the first column.
             value (str): The value to show in the second column.
         """
-        row = self.rowCount()
-        self.insertRow(row)
-        self.setItem(row, 0, _KeyCell(key))
-        self.setItem(row, 1, _TextValueCell(value))
+        valueText = _formatValue(value)
+        self._addRowCore(_Row(PropertiesTableModel.TextRow, key, valueText, value))
 
     def addHeader(self, text: str):
         """
@@ -208,11 +403,7 @@ class PropertiesTable(QtWidgets.QTableWidget):
         Args:
             text (str): The text to show in the header.
         """
-        header = _Header(text)
-        row = self.rowCount()
-        self.insertRow(row)
-        self.setSpan(row, 0, 1, 2)
-        self.setCellWidget(row, 0, header)
+        self._addRowCore(_Row(PropertiesTableModel.HeaderRow, text))
 
     def addPixmapRow(self, key: str, pixmap: QtGui.QPixmap, value: Any = None):
         """
@@ -222,32 +413,29 @@ class PropertiesTable(QtWidgets.QTableWidget):
             key (str): The key to show in the first column.
             pixmap (QPixmap): The pixmap to show in the second column.
         """
-        row = self.rowCount()
-        self.insertRow(row)
-        self.setRowHeight(row, pixmap.height())
-        self.setItem(row, 0, _KeyCell(key))
-        self.setItem(row, 1, _PixmapValueCell(pixmap, value))
+        self._addRowCore(_Row(PropertiesTableModel.PixmapRow, key, "", value, pixmap))
 
     def clear(self):
         """
         Clears the inspector panel.
         """
-        self.clearContents()
-        self.setRowCount(0)
+        if self._bulkAddDepth > 0:
+            self._pendingRows = []
+            return
+        self.clearSpans()
+        self._model.setRows([])
+        self._onSelectionChanged()
 
     @QtCore.Slot()
     def _onSelectionChanged(self):
         """
         Called when the selection changes.
         """
-        items = self.selectedItems()
+        selected = self._selectedRows()
 
         value = None
-        if len(items) == 2:  # 2 because we have 2 columns
-            for item in items:
-                if isinstance(item, _AbstractValueCell):
-                    value = item.originalValue()
-                    break
+        if len(selected) == 1:
+            value = selected[0].value
 
         if value != self._selectedValue:
             self._selectedValue = value
@@ -1,6 +1,7 @@
+import os
 import threading
-from dataclasses import dataclass
-from typing import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, NamedTuple, Optional
 
 from PySide6 import QtCore
 
@@ -8,10 +9,10 @@ from .ImageProcessorService import ImageProcessorService
 from .Models import Group, Image, Project
 
 
-@dataclass(frozen=True, slots=True)
-class BatchProgress:
+class BatchProgress(NamedTuple):
     """
-    An immutable class that represents the progress of a batch operation.
+    An immutable class that represents the progress of a batch operation. It is a NamedTuple,
+    since a new instance is created every time an image is queued or processed.
     """
     total: int = 0
     """The number of total tasks."""
@@ -38,13 +39,27 @@ class BatchProgress:
     def incrementTotal(self) -> "BatchProgress":
         """Increments the total count. If all the tasks have been completed, the progress is reset."""
         if self.total == self.value:
-            return BatchProgress(1, 0)
+            return _newBatchProgress
         else:
             return BatchProgress(self.total + 1, self.value)
 
+    def incrementTotalBy(self, count: int) -> "BatchProgress":
+        """Increments the total count by the given amount. If all the tasks have been completed, the progress is reset."""
+        if count == 0:
+            return self
+        if self.total == self.value:
+            return BatchProgress(count, 0)
+        else:
+            return BatchProgress(self.total + count, self.value)
+
     def reset(self) -> "BatchProgress":
         """Resets the progress."""
-        return BatchProgress(0, 0)
+        return _emptyBatchProgress
+
+
+_emptyBatchProgress = BatchProgress(0, 0)
+
+_newBatchProgress = BatchProgress(1, 0)  # The progress right after the first task of a batch is added
 
 
 class Workspace(QtCore.QObject):
@@ -83,6 +98,10 @@ class Workspace(QtCore.QObject):
     removed, renamed, combined or the groups are cleared or recalculated.
     """
 
+    # Used to start the batch progress timer in the main thread, since the batch progress
+    # also changes in the thread that receives the processed images.
+    _batchProgressDirty = QtCore.Signal()
+
     def __init__(self, imageProcessorService: ImageProcessorService):
         """
         Initializes a new instance of the Workspace class.
@@ -94,9 +113,27 @@ class Workspace(QtCore.QObject):
         self._imageProcessorService: ImageProcessorService = imageProcessorService
         self._project = Project()  # Empty project
         self._dirty = False
-        self._batchLock = threading.Lock()  # Lock for the batch progress and the queue
-        self._batchProgress = BatchProgress()
-        self._queuedImages: set[Image] = set()
+        # Used to load the added images in parallel. This is not the application executor because
+        # addImages() itself usually runs in that executor and waits for the loads to finish.
+        self._loadExecutor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="PhantomLoader")
+        self._batchLock = threading.Lock()  # Lock for the batch progress updates and the queue
+        self._batchProgress = _emptyBatchProgress
+        self._batchProgressIsDirty = False
+        # Used to check if anybody is connected to batchProgressChanged before scheduling an emission.
+        self._batchProgressChangedMethod = QtCore.QMetaMethod.fromSignal(self.batchProgressChanged)
+        # Keyed by id(image): the workspace always passes the same Image instances around, and
+        # this avoids the Python level Model.__hash__ and __eq__ on every enqueue and dequeue.
+        self._queuedImages: dict[int, Image] = {}
+        self._queuedImagesSnapshot: Optional[frozenset[Image]] = None  # None when it needs to be rebuilt
+
+        # The first update of a burst and the final state are emitted right away. The updates in
+        # between are emitted at most once every 50 ms, so adding or processing many images does
+        # not update the progress bar once per image.
+        self._batchProgressTimer = QtCore.QTimer(self)
+        self._batchProgressTimer.setSingleShot(True)
+        self._batchProgressTimer.setInterval(50)
+        self._batchProgressTimer.timeout.connect(self._onBatchProgressTimeout)
+        self._batchProgressDirty.connect(self._onBatchProgressDirty)
 
     def project(self) -> Project:
         """
@@ -128,37 +165,107 @@ class Workspace(QtCore.QObject):
 
     def queuedImages(self) -> frozenset[Image]:
         """
-        Returns a set of images that are currently in the queue.
+        Returns a snapshot of the set of images that are currently in the queue. The snapshot is
+        only rebuilt after the queue changes, so repeated calls return the same frozenset.
+        """
+        snapshot = self._queuedImagesSnapshot
+        if snapshot is not None:  # Published with a single assignment, safe to read without the lock
+            return snapshot
+        with self._batchLock:
+            if self._queuedImagesSnapshot is None:
+                self._queuedImagesSnapshot = frozenset(self._queuedImages.values())
+            return self._queuedImagesSnapshot
+
+    def isImageQueued(self, image: Image) -> bool:
+        """
+        Returns True if the given image is currently in the queue.
+        """
+        with self._batchLock:
+            return id(image) in self._queuedImages
+
+    def queuedImagesCount(self) -> int:
+        """
+        Returns the number of images that are currently in the queue.
         """
         with self._batchLock:
-            return frozenset(self._queuedImages)
+            return len(self._queuedImages)
 
-    def _addImageToBatch(self, image: Image):
+    def _addImagesToBatch(self, images: list[Image]):
         """
-        Adds an image to the batch.
+        Adds a list of images to the batch, taking the lock and updating the progress only once.
         """
         with self._batchLock:
-            if image not in self._queuedImages:
-                self._queuedImages.add(image)
-                self._batchProgress = self._batchProgress.incrementTotal()
-                self.batchProgressChanged.emit(self._batchProgress)
+            count = 0
+            for image in images:
+                if id(image) not in self._queuedImages:
+                    self._queuedImages[id(image)] = image
+                    count += 1
+            if count == 0:
+                return
+            self._queuedImagesSnapshot = None
+            self._batchProgress = self._batchProgress.incrementTotalBy(count)
+            schedule = self._markBatchProgressDirty()
+        if schedule:
+            self._batchProgressDirty.emit()
 
     def _removeImageFromBatch(self, image: Image):
         """
         Removes an image from the batch.
         """
         with self._batchLock:
-            if image in self._queuedImages:
-                self._queuedImages.remove(image)
-                self._batchProgress = self._batchProgress.advance()
-                self.batchProgressChanged.emit(self._batchProgress)
+            if self._queuedImages.pop(id(image), None) is None:
+                return
+            self._queuedImagesSnapshot = None
+            self._batchProgress = self._batchProgress.advance()
+            schedule = self._markBatchProgressDirty()
+        if schedule:
+            self._batchProgressDirty.emit()
+
+    def _markBatchProgressDirty(self) -> bool:
+        """
+        Marks the batch progress as changed. This method must be called while holding the batch lock,
+        so each queued or processed image only takes the lock once. Returns True if the caller must
+        schedule the emission of the batchProgressChanged signal (after releasing the lock).
+        """
+        if not self.isSignalConnected(self._batchProgressChangedMethod):  # Nobody is listening
+            return False
+        if self._batchProgressIsDirty and not self._batchProgress.isFinished:  # Already scheduled
+            return False
+        self._batchProgressIsDirty = True
+        return True
+
+    @QtCore.Slot()
+    def _onBatchProgressDirty(self):
+        if self._batchProgressTimer.isActive() and not self._batchProgress.isFinished:
+            return  # Throttled, the timer emits the latest progress
+        self._emitBatchProgress()
+        self._batchProgressTimer.start()
+
+    @QtCore.Slot()
+    def _onBatchProgressTimeout(self):
+        if self._emitBatchProgress():  # The progress changed while throttled, keep throttling
+            self._batchProgressTimer.start()
+
+    def _emitBatchProgress(self) -> bool:
+        """
+        Emits the batchProgressChanged signal if the progress changed since the last emission.
+        Returns True if the signal was emitted.
+        """
+        with self._batchLock:
+            if not self._batchProgressIsDirty:
+                return False
+            self._batchProgressIsDirty = False
+            progress = self._batchProgress
+        self.batchProgressChanged.emit(progress)  # Emitted outside the lock
+        return True
 
     def batchProgress(self) -> BatchProgress:
         """
         Returns the current batch progress.
         """
-        with self._batchLock:
-            return self._batchProgress
+        # BatchProgress is immutable and it is replaced with a single assignment,
+        # so it can be read without taking the lock.
+        return self._batchProgress
 
     def closeProject(self):
         """
@@ -177,13 +284,15 @@ class Workspace(QtCore.QObject):
             onProgress: Callable[[int, int, Image], None] = None,
             onImageError: Callable[[Exception, Image], bool] = None):
         """
-        Adds a list of images to the current project.
+        Adds a list of images to the current project. Images with the same contents (the same SHA-256)
+        as an image that is already in the project, or earlier in the list, are skipped, so duplicates
+        are never sent to the face detector.
 
         Args:
             images (list[Image]): The list of images to add or the paths of the images to add.
                 The images will be loaded from the disk if they are not already loaded.
             onProgress (Callable[[int, int, Image], None]): A callback that is called when an image
-                is loaded (or failed to load). The callback receives the current index, the total
+                is loaded (or skipped as a duplicate). The callback receives the current index, the total
                 number of images and the image that was loaded.
             onImageError (Callable[[Exception, Image], None]): A callback that is called when an
                 image fails to load. The callback receives the exception and the image that failed
@@ -194,26 +303,68 @@ class Workspace(QtCore.QObject):
         onImageError = onImageError or (lambda e, image: False)
         imagesAdded = []
         count = len(images)
-        for index, image in enumerate(images):
-            try:
-                image.load()  # If the image is already loaded, this is a no-op
-            except Exception as e:
+        knownHashes = {image.hashes.get("sha256") for image in self._project.images}
+        # The images are loaded and hashed in parallel, but the results are consumed in order,
+        # so the images are added to the project in the same order as they were given.
+        futures = [self._loadExecutor.submit(self._loadImage, image, knownHashes) for image in images]
+        for index, (image, future) in enumerate(zip(images, futures)):
+            e = future.exception()
+            if e is not None:
                 if onImageError(e, image):
                     continue
                 else:
+                    self._cancelFutures(futures[index + 1:])
                     break
 
-            image.compute_hashes()
+            sha256 = image.hashes.get("sha256")
+            if not future.result() or sha256 in knownHashes:  # Duplicated image
+                onProgress(index, count, image)
+                continue
+
+            knownHashes.add(sha256)
             self._project.add_image(image)
             imagesAdded.append(image)
             onProgress(index, count, image)
-            self._addImageToBatch(image)
+
+        # The images are added to the batch all at once, before any of them is sent to the
+        # processor (already processed images are reported back synchronously).
+        self._addImagesToBatch(imagesAdded)
+        for image in imagesAdded:
             self._imageProcessorService.process(image, self._onImageSuccess, self._onImageError)
 
         if len(imagesAdded) > 0:
             self.imagesAdded.emit(imagesAdded)
             self.setDirty(True)
 
+    @staticmethod
+    def _loadImage(image: Image, knownHashes: set[str]) -> bool:
+        """
+        Computes the hashes of an image and loads it. This method is called in a worker thread.
+        Returns False if the image is a duplicate of one of the known hashes, in which case the
+        image is not decoded.
+        """
+        if image.is_loaded:
+            image.compute_hashes()
+            return True
+        # Read the file once, and use the same bytes for the hashes and for decoding.
+        fileBytes = image.read_file_bytes()
+        image.compute_hashes(fileBytes)
+        if image.hashes["sha256"] in knownHashes:
+            return False
+        image.load_from_bytes(fileBytes)
+        return True
+
+    @staticmethod
+    def _cancelFutures(futures: list[Future]) -> None:
+        """
+        Cancels the loads that have not started yet and waits for the running ones to finish.
+        """
+        for future in futures:
+            future.cancel()
+        for future in futures:
+            if not future.cancelled():
+                future.exception()  # Wait, the error (if any) is ignored
+
     def removeImage(self, image: Image):
         """
         Removes an image from the current project.
@@ -261,8 +412,7 @@ class Workspace(QtCore.QObject):
             return
 
         # Add the faces to the best matching group (or create a new group)
-        for face in image.faces:
-            self._project.add_face_to_best_group(face)
+        self._project.add_faces_to_best_groups(image.faces)
         self.groupsChanged.emit()
 
     def mergeGroups(self, groupA: Group, groupB: Group):
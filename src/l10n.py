@@ -1,6 +1,15 @@
 from dataclasses import dataclass
-import json
 import logging
+import sys
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup, the standard json module is used otherwise
+    from json import loads as _json_loads
+
+
+_service = None  # type: LocalizationService
+"""The localization service instance, bound once it is created so __() does not go through instance()."""
 
 
 def __(key_or_string: str, **kwargs) -> str:
@@ -14,7 +23,10 @@ def __(key_or_string: str, **kwargs) -> str:
     Returns:
         str: The localized string.
     """
-    return LocalizationService.instance().get(key_or_string, **kwargs)
+    service = _service or LocalizationService.instance()
+    if not kwargs:  # Avoids packing the empty keyword arguments again
+        return service.get_plain(key_or_string)
+    return service.get(key_or_string, **kwargs)
 
 
 @dataclass
@@ -114,6 +126,7 @@ class LocalizationService:
         Initializes the LocalizationService class.
         """
         self._strings: dict[str, str] = {}
+        self._formatted: dict[str, str] = {}  # Cache for the strings requested without arguments
         self._locale: str = "en"
         self._fallback_locale: str = "en"
         self._warned_strings: set[str] = set()
@@ -129,8 +142,9 @@ class LocalizationService:
         Returns:
             LocalizationService: The instance of the localization service.
         """
+        global _service
         if not LocalizationService._instance:
-            LocalizationService._instance = LocalizationService()
+            LocalizationService._instance = _service = LocalizationService()
 
         return LocalizationService._instance
 
@@ -144,6 +158,8 @@ class LocalizationService:
             locale (str): The language code to set.
             fallback_locale (str, optional): The fallback language code to use. Defaults to "en".
         """
+        if locale == self._locale:  # The strings are already loaded (the default locale is loaded on startup)
+            return
         self._locale = locale
         self._load_strings()
 
@@ -152,6 +168,7 @@ class LocalizationService:
         Loads the strings.
         """
         self._strings = {}
+        self._formatted = {}
         self._warned_strings = set()
         if self._fallback_locale and self._locale != self._fallback_locale and not self.ignore_fallback:
             self._load_strings_for_locale(self._fallback_locale)
@@ -165,31 +182,32 @@ class LocalizationService:
             locale (str): The locale.
         """
         try:
-            with open("res/lang/" + locale + ".json", "r", encoding="utf-8") as file:
-                data = json.load(file)
-                self._strings.update(self._flatten(data))
+            with open("res/lang/" + locale + ".json", "rb") as file:
+                data = _json_loads(file.read())
+                self._flatten_into(data, self._strings)
         except FileNotFoundError:
             pass
 
-    def _flatten(self, data: dict, prefix: str = ""):
+    def _flatten_into(self, data: dict, out: dict[str, str]):
         """
-        Flattens the given dictionary.
+        Flattens the given dictionary into the output dictionary. Nested keys are joined with dots.
+        The nested dictionaries are walked with a stack instead of recursion, and the strings
+        are written straight into the output, without intermediate dictionaries.
 
         Args:
             data (dict): The dictionary to flatten.
-            prefix (str, optional): The prefix to use. Defaults to "".
-
-        Returns:
-            dict: The flattened dictionary.
+            out (dict[str, str]): The dictionary where the flattened strings are written.
         """
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, dict):
-                result.update(self._flatten(value, prefix + key + "."))
-            else:
-                result[prefix + key] = value
-
-        return result
+        stack = [(data, "")]
+        while stack:
+            current, prefix = stack.pop()
+            for key, value in current.items():
+                if isinstance(value, dict):
+                    stack.append((value, prefix + key + "."))
+                else:
+                    # The keys read from JSON are not interned. Interning them means that looking up a string
+                    # literal (which Python already interns) matches by identity, without comparing characters.
+                    out[sys.intern(prefix + key)] = value
 
     def get_language(self) -> str:
         """
@@ -211,13 +229,51 @@ class LocalizationService:
         Returns:
             str: The localized string.
         """
-        if key_or_string in self._strings:
-            result = self._strings[key_or_string]
-        else:
+        if not kwargs:
+            return self.get_plain(key_or_string)
+
+        return self._format(self._get_template(key_or_string), **kwargs)
+
+    def get_plain(self, key_or_string: str) -> str:
+        """
+        Gets the localized string for the given key or string, without formatting arguments.
+
+        Args:
+            key_or_string (str): The key or string to localize.
+
+        Returns:
+            str: The localized string.
+        """
+        # Most strings are requested without arguments (labels, menus, tooltips...),
+        # so the formatted result is cached until the strings are reloaded.
+        result = self._formatted.get(key_or_string)
+        if result is None:
+            result = self._formatted[key_or_string] = self._format(self._get_template(key_or_string))
+        return result
+
+    @staticmethod
+    def _format(template: str, **kwargs) -> str:
+        """
+        Formats the given template. Templates without braces (most of them) are returned
+        as they are, without going through the str.format() parser.
+        """
+        return template.format(**kwargs) if "{" in template or "}" in template else template
+
+    def _get_template(self, key_or_string: str) -> str:
+        """
+        Gets the unformatted localized string for the given key or string.
+
+        Args:
+            key_or_string (str): The key or string to localize.
+
+        Returns:
+            str: The unformatted localized string.
+        """
+        result = self._strings.get(key_or_string)
+        if result is None:
             result = key_or_string
             self._warn_missing_string(key_or_string)
-
-        return result.format(**kwargs)
+        return result
 
     def _warn_missing_string(self, key: str):
         """
@@ -237,8 +293,8 @@ class LocalizationService:
         """
         Loads the languages.
         """
-        with open("res/lang/languages.json", "r", encoding="utf-8") as file:
-            data = json.load(file)
+        with open("res/lang/languages.json", "rb") as file:
+            data = _json_loads(file.read())
             self._fallback_locale = data["fallback_lang"]
             self._languages = [Language(**lang) for lang in data["langs"]]
 
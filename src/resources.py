@@ -0,0 +1,62 @@
+from PySide6 import QtCore, QtGui
+
+
+_icons = {}  # type: dict[str, QtGui.QIcon]
+_images = {}  # type: dict[str, QtGui.QImage]
+_pixmaps = {}  # type: dict[tuple[str, int, int], QtGui.QPixmap]
+
+
+def icon(path: str) -> QtGui.QIcon:
+    """
+    Gets the icon for the given resource path. Each file is only read once,
+    the next calls return the same icon.
+
+    Args:
+        path (str): The path of the icon. For example: "res/img/face.png".
+
+    Returns:
+        QIcon: The icon.
+    """
+    value = _icons.get(path)
+    if value is None:
+        value = _icons[path] = QtGui.QIcon(path)
+    return value
+
+
+def image(path: str) -> QtGui.QImage:
+    """
+    Gets the image for the given resource path. Each file is only read and decoded once,
+    the next calls return the same image.
+
+    Args:
+        path (str): The path of the image. For example: "res/img/spinner.png".
+
+    Returns:
+        QImage: The image.
+    """
+    value = _images.get(path)
+    if value is None:
+        value = _images[path] = QtGui.QImage(path)
+    return value
+
+
+def scaled_pixmap(path: str, width: int, height: int) -> QtGui.QPixmap:
+    """
+    Gets the image for the given resource path, smoothly scaled to fit in the given size
+    keeping the aspect ratio. Each file and size is only scaled once, the next calls
+    return the same pixmap.
+
+    Args:
+        path (str): The path of the image. For example: "res/img/add.png".
+        width (int): The maximum width of the pixmap.
+        height (int): The maximum height of the pixmap.
+
+    Returns:
+        QPixmap: The scaled pixmap.
+    """
+    key = (path, width, height)
+    value = _pixmaps.get(key)
+    if value is None:
+        scaled = image(path).scaled(width, height, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        value = _pixmaps[key] = QtGui.QPixmap.fromImage(scaled)
+    return value